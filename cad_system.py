@@ -8,8 +8,53 @@ from ursina import *
 import random
 import numpy as np
 import time
+from time import perf_counter_ns
+from scipy.spatial import cKDTree
+from numba import njit
+
+
+# Ursina colors bound once so hot paths do a single global lookup
+_WHITE = color.white
+_YELLOW = color.yellow
+_LIGHT_GRAY = color.light_gray
+_GRAY = color.gray
+_BLUE = color.blue
+_RED = color.red
+_LIME = color.lime
+
+# Primitive cycling order with its display labels precomputed
+_NEXT_PRIM = {"box": "sphere", "sphere": "cylinder", "cylinder": "pyramid", "pyramid": "box"}
+_PRIM_LABELS = {prim: f'PRIMITIVE: {prim.upper()}' for prim in _NEXT_PRIM}
+
+
+@njit(cache=True, fastmath=True)
+def _snap_batch(arr, gs):
+    """Snap an (N,3) array of positions to int16 grid units (multiples of gs)"""
+    out = np.empty(arr.shape, dtype=np.int16)
+    inv = 1.0 / gs
+    for i in range(arr.shape[0]):
+        for j in range(3):
+            u = round(arr[i, j] * inv)
+            out[i, j] = min(max(u, -32768), 32767)
+    return out
+
+
+# Compile once at import so the first placement gesture doesn't stall
+_snap_batch(np.zeros((1, 3)), 0.5)
+
 
 class CADSystem:
+    # Below this many objects a plain scan beats building a KD-tree
+    KDTREE_MIN_OBJECTS = 32
+    
+    # Primitive type -> (Ursina model name, action text)
+    _PRIM_SPEC = {
+        "box": ("cube", "BOX CREATED"),
+        "sphere": ("sphere", "SPHERE CREATED"),
+        "cylinder": ("cylinder", "CYLINDER CREATED"),
+        "pyramid": ("cone", "PYRAMID CREATED"),
+    }
+    
     def __init__(self, parent_controller):
         self.controller = parent_controller
         
@@ -18,20 +63,59 @@ class CADSystem:
         self.current_tool = "select"
         self.primitive_type = "box"
         self.selected_objects = []
+        self._selected_set = set()  # id()s of selected_objects for O(1) membership
         self.hover_object = None
         
+        # Hover raycasts are throttled to 20 Hz
+        self._last_hover_check_ns = 0
+        self._hover_interval_ns = 50_000_000
+        
         # Grid settings
         self.grid_visible = False
         self.grid_size = 0.5
         self.snap_to_grid = True
         self.grid_entities = []
         
-        # Tool last used timestamps (for cooldown)
-        self.last_tool_use = {}
+        # Tool last used timestamps in perf_counter_ns units (for cooldown),
+        # seeded so the first use of every tool is allowed
         self.tool_cooldown = 1.0  # seconds
+        self._tool_cooldown_ns = int(self.tool_cooldown * 1_000_000_000)
+        self.last_tool_use = dict.fromkeys(
+            ("select", "create", "move", "scale", "rotate", "extrude"),
+            -self._tool_cooldown_ns
+        )
+        
+        # Object positions as an (N,3) array with parallel entity refs, plus a
+        # spatial index over them (rebuilt lazily when objects change). Drones
+        # hover every frame, so they get their own small array scanned per query
+        self._pos_array = np.empty((0, 3), dtype=np.float32)
+        self._obj_refs = []
+        self._kdtree = None
+        self._scene_dirty = True
+        self._drone_pos = np.empty((0, 3), dtype=np.float32)
+        self._drone_refs = []
+        self._drones_dirty = True
+        
+        # Scene bounds for cheap early-out: an AABB over everything and a
+        # bounding sphere (center, radius) per group (objects, drones)
+        self._scene_aabb_min = np.full(3, np.inf, dtype=np.float32)
+        self._scene_aabb_max = np.full(3, -np.inf, dtype=np.float32)
+        self._obj_bounds = None
+        self._drone_bounds = None
+        self._group_spheres = []
+        
+        # Selected objects' transforms as parallel SoA arrays, re-gathered
+        # lazily whenever the selection or the scene changes underneath them
+        self._sel_pos = np.empty((0, 3), dtype=np.float32)
+        self._sel_scale = np.empty((0, 3), dtype=np.float32)
+        self._sel_rot_y = np.empty(0, dtype=np.float32)
+        self._sel_cube_idx = np.empty(0, dtype=np.intp)
+        self._sel_stale = True
+        self._sel_has_drone = False  # Hovering drones move every frame, so only then re-gather
         
         # Create grid
         self.create_grid()
+        self._grid_ids = frozenset(map(id, self.grid_entities))
         
         # Create CAD-specific UI
         self.setup_ui()
@@ -39,27 +123,39 @@ class CADSystem:
     def create_grid(self):
         """Create a reference grid for CAD mode"""
         grid_size = 10
+        steps = np.arange(-grid_size, grid_size + 1, dtype=np.float32) * self.grid_size
         
-        # Create horizontal grid lines
-        for i in range(-grid_size, grid_size + 1):
-            line = Entity(
-                model=Mesh(vertices=[(-grid_size, 0, i * self.grid_size), (grid_size, 0, i * self.grid_size)], 
-                           mode='line'),
-                color=color.gray if i != 0 else color.blue,
-                position=(0, 0, 0)
-            )
-            self.grid_entities.append(line)
-            line.visible = False
-            
-        # Create vertical grid lines
-        for i in range(-grid_size, grid_size + 1):
-            line = Entity(
-                model=Mesh(vertices=[(i * self.grid_size, 0, -grid_size), (i * self.grid_size, 0, grid_size)], 
-                           mode='line'),
-                color=color.gray if i != 0 else color.red,
-                position=(0, 0, 0)
-            )
-            self.grid_entities.append(line)
+        # Line endpoints as [direction, line, endpoint, xyz]:
+        # direction 0 runs along x (horizontal), direction 1 along z (vertical)
+        lines = np.zeros((2, len(steps), 2, 3), dtype=np.float32)
+        lines[0, :, 0, 0] = -grid_size
+        lines[0, :, 1, 0] = grid_size
+        lines[0, :, :, 2] = steps[:, None]
+        lines[1, :, :, 0] = steps[:, None]
+        lines[1, :, 0, 2] = -grid_size
+        lines[1, :, 1, 2] = grid_size
+        
+        # The i == 0 lines become the colored axes, everything else is gray
+        gray_vertices = np.delete(lines, grid_size, axis=1).reshape(-1, 3)
+        axis_vertices = lines[:, grid_size].reshape(-1, 3)
+        
+        self.grid_lines_gray = Entity(
+            model=Mesh(vertices=gray_vertices.tolist(),
+                       triangles=[(i, i + 1) for i in range(0, len(gray_vertices), 2)],
+                       mode='line'),
+            color=_GRAY,
+            position=(0, 0, 0)
+        )
+        self.grid_lines_axes = Entity(
+            model=Mesh(vertices=axis_vertices.tolist(),
+                       triangles=[(0, 1), (2, 3)],
+                       colors=[_BLUE, _BLUE, _RED, _RED],
+                       mode='line'),
+            position=(0, 0, 0)
+        )
+        
+        self.grid_entities = [self.grid_lines_gray, self.grid_lines_axes]
+        for line in self.grid_entities:
             line.visible = False
             
     def setup_ui(self):
@@ -68,7 +164,7 @@ class CADSystem:
             'CAD MODE: OFF',
             position=(-0.85, 0.25),
             scale=1.0,
-            color=color.lime
+            color=_LIME
         )
         self.tool_display.visible = False
         
@@ -76,7 +172,7 @@ class CADSystem:
             'PRIMITIVE: BOX',
             position=(-0.85, 0.15),
             scale=0.8,
-            color=color.lime
+            color=_LIME
         )
         self.primitive_display.visible = False
         
@@ -86,7 +182,7 @@ class CADSystem:
             '4 FINGERS - Scale | THUMB+INDEX+PINKY - Rotate | ROCK - Extrude',
             position=(-0.85, -0.35),
             scale=0.7,
-            color=color.light_gray
+            color=_LIGHT_GRAY
         )
         self.help_text.visible = False
         
@@ -124,33 +220,152 @@ class CADSystem:
         else:
             self.grid_visible = not self.grid_visible
             
-        for entity in self.grid_entities:
-            entity.visible = self.grid_visible
+        self.grid_lines_gray.visible = self.grid_visible
+        self.grid_lines_axes.visible = self.grid_visible
             
     def set_tool(self, tool_name):
         """Set the current CAD tool"""
         self.current_tool = tool_name
-        self.tool_display.text = f'CAD TOOL: {tool_name.upper()}'
+        self.update_tool_display()
+        
+    def update_tool_display(self):
+        """Show the current tool in the CAD UI (touches Ursina, so main thread only)"""
+        self.tool_display.text = f'CAD TOOL: {self.current_tool.upper()}'
         
     def cycle_primitive(self):
         """Cycle through primitive types"""
-        primitives = ["box", "sphere", "cylinder", "pyramid"]
-        current_index = primitives.index(self.primitive_type) if self.primitive_type in primitives else 0
-        self.primitive_type = primitives[(current_index + 1) % len(primitives)]
-        self.primitive_display.text = f'PRIMITIVE: {self.primitive_type.upper()}'
+        self.primitive_type = _NEXT_PRIM.get(self.primitive_type, "box")
+        self.primitive_display.text = _PRIM_LABELS[self.primitive_type]
         
     def can_use_tool(self, tool_name):
         """Check if tool can be used (cooldown timer)"""
-        now = time.time()
-        if tool_name not in self.last_tool_use:
-            self.last_tool_use[tool_name] = 0
-            
-        if now - self.last_tool_use[tool_name] > self.tool_cooldown:
-            self.last_tool_use[tool_name] = now
+        t = perf_counter_ns()
+        if t - self.last_tool_use[tool_name] > self._tool_cooldown_ns:
+            self.last_tool_use[tool_name] = t
             return True
             
         return False
         
+    def mark_scene_dirty(self):
+        """Flag the spatial index for rebuild after objects or drones are added, removed or moved"""
+        self._scene_dirty = True
+        self._drones_dirty = True
+        self._sel_stale = True
+        
+    def mark_drones_moved(self):
+        """Flag drone positions for re-gather; selection arrays only go stale if a drone is selected"""
+        self._drones_dirty = True
+        if self._sel_has_drone:
+            self._sel_stale = True
+            
+    def _sync_selection_arrays(self):
+        """Gather selected positions, scales and y-rotations into the SoA arrays"""
+        sel = self.selected_objects
+        drone_ids = set(map(id, self.controller.drones))
+        self._sel_has_drone = any(id(o) in drone_ids for o in sel)
+        self._sel_pos = np.array([[o.x, o.y, o.z] for o in sel], dtype=np.float32).reshape(-1, 3)
+        self._sel_scale = np.array([[o.scale.x, o.scale.y, o.scale.z] for o in sel], dtype=np.float32).reshape(-1, 3)
+        self._sel_rot_y = np.array([o.rotation_y for o in sel], dtype=np.float32)
+        self._sel_cube_idx = np.flatnonzero([o.model_name == 'cube' for o in sel])
+        self._sel_stale = False
+        
+    @staticmethod
+    def _group_bounds(pos):
+        """(aabb_min, aabb_max, (center, radius)) of an (N,3) position array, or None if empty"""
+        if not len(pos):
+            return None
+        center = pos.mean(axis=0)
+        d = pos - center
+        return pos.min(axis=0), pos.max(axis=0), (center, float(np.sqrt(np.einsum('ij,ij->i', d, d).max())))
+        
+    def _refresh_scene_index(self, objects, drones):
+        """Rebuild the object array/KD-tree and re-gather drone positions, each only if it changed"""
+        if not (self._scene_dirty or self._drones_dirty):
+            return
+            
+        if self._scene_dirty:
+            self._obj_refs = [obj for obj in objects if obj]
+            self._pos_array = np.array(
+                [[o.position.x, o.position.y, o.position.z] for o in self._obj_refs],
+                dtype=np.float32
+            ).reshape(-1, 3)
+            self._obj_bounds = self._group_bounds(self._pos_array)
+            
+            if len(self._obj_refs) >= self.KDTREE_MIN_OBJECTS:
+                self._kdtree = cKDTree(self._pos_array, leafsize=16)
+            else:
+                self._kdtree = None
+            self._scene_dirty = False
+            
+        if self._drones_dirty:
+            self._drone_refs = [drone for drone in drones if drone]
+            self._drone_pos = np.array(
+                [[d.position.x, d.position.y, d.position.z] for d in self._drone_refs],
+                dtype=np.float32
+            ).reshape(-1, 3)
+            self._drone_bounds = self._group_bounds(self._drone_pos)
+            self._drones_dirty = False
+            
+        groups = [g for g in (self._obj_bounds, self._drone_bounds) if g is not None]
+        if groups:
+            self._scene_aabb_min = np.minimum.reduce([g[0] for g in groups])
+            self._scene_aabb_max = np.maximum.reduce([g[1] for g in groups])
+        else:
+            self._scene_aabb_min = np.full(3, np.inf, dtype=np.float32)
+            self._scene_aabb_max = np.full(3, -np.inf, dtype=np.float32)
+        self._group_spheres = [g[2] for g in groups]
+        
+    def _is_near_scene(self, q, radius, r2):
+        """Constant-time check whether anything could lie within radius (r2 = radius squared) of q"""
+        lo = self._scene_aabb_min
+        hi = self._scene_aabb_max
+        dx = max(0.0, lo[0] - q[0], q[0] - hi[0])
+        dy = max(0.0, lo[1] - q[1], q[1] - hi[1])
+        dz = max(0.0, lo[2] - q[2], q[2] - hi[2])
+        if dx * dx + dy * dy + dz * dz > r2:
+            return False
+            
+        for center, sphere_radius in self._group_spheres:
+            d = q - center
+            reach = sphere_radius + radius
+            if d @ d <= reach * reach:
+                return True
+                
+        return False
+        
+    @staticmethod
+    def _scan_closest(pos, refs, q, r2):
+        """Nearest of refs within sqrt(r2) of q, inclusive like the KD-tree query, as (squared distance, ref)"""
+        if not len(refs):
+            return np.inf, None
+        d = pos - q
+        sq = np.einsum('ij,ij->i', d, d)
+        i = int(np.argmin(sq))
+        if sq[i] <= r2:
+            return sq[i], refs[i]
+        return np.inf, None
+        
+    def _find_closest_object(self, q, radius, r2):
+        """Return the indexed object or drone nearest to q within radius, or None (compares squared distances)"""
+        if self._kdtree is None:
+            # Small scene: one vectorized squared-distance pass
+            best_sq, best = self._scan_closest(self._pos_array, self._obj_refs, q, r2)
+        else:
+            # Query only the objects within radius, then pick the nearest
+            best_sq, best = np.inf, None
+            idxs = self._kdtree.query_ball_point(q, r=radius)
+            if idxs:
+                d = self._pos_array[idxs] - q
+                sq = np.einsum('ij,ij->i', d, d)
+                k = int(np.argmin(sq))
+                best_sq, best = sq[k], self._obj_refs[idxs[k]]
+                
+        # Drones are few and always moving: scan them directly
+        drone_sq, drone = self._scan_closest(self._drone_pos, self._drone_refs, q, r2)
+        if drone_sq < best_sq:
+            return drone
+        return best
+        
     def clear_selection(self):
         """Clear currently selected objects"""
         for obj in self.selected_objects:
@@ -158,6 +373,8 @@ class CADSystem:
                 obj.color = obj.original_color
                 
         self.selected_objects = []
+        self._selected_set.clear()
+        self._sel_stale = True
         
     def select_object_at(self, position, radius=0.5):
         """Select object near position"""
@@ -166,23 +383,25 @@ class CADSystem:
             return
             
         closest_obj = None
-        closest_distance = float('inf')
         
         # Find closest object to position
-        all_objects = self.controller.objects + self.controller.drones
-        for obj in all_objects:
-            if obj:
-                dist = distance(position, obj.position)
-                if dist < closest_distance and dist < radius:
-                    closest_distance = dist
-                    closest_obj = obj
+        self._refresh_scene_index(self.controller.objects, self.controller.drones)
+        q = np.array([position.x, position.y, position.z], dtype=np.float32)
+        
+        r2 = radius * radius
+        
+        # Skip the search entirely when the hand is away from the scene
+        if self._is_near_scene(q, radius, r2):
+            closest_obj = self._find_closest_object(q, radius, r2)
         
         # Handle selection
         if closest_obj:
-            if closest_obj in self.selected_objects:
+            if id(closest_obj) in self._selected_set:
                 # Deselect if already selected
                 self.selected_objects.remove(closest_obj)
-                closest_obj.color = closest_obj.original_color if hasattr(closest_obj, 'original_color') else color.white
+                self._selected_set.discard(id(closest_obj))
+                self._sel_stale = True
+                closest_obj.color = closest_obj.original_color if hasattr(closest_obj, 'original_color') else _WHITE
                 self.controller.action_display.text = "OBJECT DESELECTED"
             else:
                 # Select object
@@ -190,18 +409,16 @@ class CADSystem:
                     closest_obj.original_color = closest_obj.color
                 
                 self.selected_objects.append(closest_obj)
-                closest_obj.color = color.yellow  # Highlight color
+                self._selected_set.add(id(closest_obj))
+                self._sel_stale = True
+                closest_obj.color = _YELLOW  # Highlight color
                 self.controller.action_display.text = "OBJECT SELECTED"
                 
             self.controller.play_sound_effect("select")
         else:
             # If clicking empty space, clear selection
-            for obj in self.selected_objects:
-                if hasattr(obj, 'original_color'):
-                    obj.color = obj.original_color
-                    
-            self.selected_objects = []
-            if all_objects:  # Only update text if there are objects
+            self.clear_selection()
+            if self.controller.objects or self.controller.drones:  # Only update text if there are objects
                 self.controller.action_display.text = "SELECTION CLEARED"
     
     def place_object_at(self, position):
@@ -215,49 +432,19 @@ class CADSystem:
             position = self.snap_position_to_grid(position)
             
         # Create object based on current primitive type
-        if self.primitive_type == "box":
-            obj = Entity(
-                model='cube',
-                color=color.white,
-                scale=(1, 1, 1),
-                position=position
-            )
-            obj.original_color = color.white
-            self.controller.objects.append(obj)
-            self.controller.action_display.text = "BOX CREATED"
-            
-        elif self.primitive_type == "sphere":
-            obj = Entity(
-                model='sphere',
-                color=color.white,
-                scale=(1, 1, 1),
-                position=position
-            )
-            obj.original_color = color.white
-            self.controller.objects.append(obj)
-            self.controller.action_display.text = "SPHERE CREATED"
-            
-        elif self.primitive_type == "cylinder":
-            obj = Entity(
-                model='cylinder',
-                color=color.white,
-                scale=(1, 1, 1),
-                position=position
-            )
-            obj.original_color = color.white
-            self.controller.objects.append(obj)
-            self.controller.action_display.text = "CYLINDER CREATED"
-            
-        elif self.primitive_type == "pyramid":
+        spec = self._PRIM_SPEC.get(self.primitive_type)
+        if spec:
+            model_name, msg = spec
             obj = Entity(
-                model='cone',
-                color=color.white,
+                model=model_name,
+                color=_WHITE,
                 scale=(1, 1, 1),
                 position=position
             )
-            obj.original_color = color.white
+            obj.original_color = _WHITE
             self.controller.objects.append(obj)
-            self.controller.action_display.text = "PYRAMID CREATED"
+            self.controller.action_display.text = msg
+            self.controller.mark_scene_dirty()
             
         self.controller.play_sound_effect("spawn")
     
@@ -270,46 +457,45 @@ class CADSystem:
         if self.snap_to_grid:
             position = self.snap_position_to_grid(position)
             
-        # Calculate center of selected objects
-        center = Vec3(0, 0, 0)
-        for obj in self.selected_objects:
-            center += obj.position
-        center /= len(self.selected_objects)
-        
-        # Calculate offset
-        offset = position - center
+        if self._sel_stale:
+            self._sync_selection_arrays()
+        P = self._sel_pos
+            
+        # Offset from the selection center, applied gradually to all objects
+        center = P.mean(axis=0)
+        offset = np.array([position.x, position.y, position.z], dtype=np.float32) - center
+        alpha = min(1.0, time.dt * 5)
+        P += offset * alpha
         
-        # Apply movement to all selected objects
-        for obj in self.selected_objects:
-            obj.position = lerp(obj.position, obj.position + offset, time.dt * 5)
+        for i, obj in enumerate(self.selected_objects):
+            obj.position = Vec3(float(P[i, 0]), float(P[i, 1]), float(P[i, 2]))
+            
+        # SoA arrays already match the entities; only the scene caches are stale
+        self._scene_dirty = True
+        self._drones_dirty |= self._sel_has_drone
+        self.controller.invalidate_object_cache()
             
     def snap_position_to_grid(self, position):
         """Snap a position to the nearest grid point"""
-        return Vec3(
-            round(position.x / self.grid_size) * self.grid_size,
-            round(position.y / self.grid_size) * self.grid_size, 
-            round(position.z / self.grid_size) * self.grid_size
-        )
+        units = _snap_batch(np.array([[position.x, position.y, position.z]]), self.grid_size)[0]
+        gs = self.grid_size
+        return Vec3(float(units[0]) * gs, float(units[1]) * gs, float(units[2]) * gs)
     
     def scale_selected_objects(self, scale_factor):
         """Scale selected objects"""
         if not self.selected_objects:
             return
             
-        for obj in self.selected_objects:
-            # Apply scale gradually
-            target_scale = obj.scale * (1 + (scale_factor - 1) * time.dt * 2)
-            
-            # Limit scale to reasonable bounds
-            max_scale = 5
-            min_scale = 0.1
-            
-            # Apply limits
-            target_scale.x = max(min_scale, min(max_scale, target_scale.x))
-            target_scale.y = max(min_scale, min(max_scale, target_scale.y))
-            target_scale.z = max(min_scale, min(max_scale, target_scale.z))
-            
-            obj.scale = target_scale
+        if self._sel_stale:
+            self._sync_selection_arrays()
+        S = self._sel_scale
+        
+        # Apply scale gradually, clamped to reasonable bounds
+        S *= 1 + (scale_factor - 1) * time.dt * 2
+        np.clip(S, 0.1, 5.0, out=S)
+        
+        for i, obj in enumerate(self.selected_objects):
+            obj.scale = Vec3(float(S[i, 0]), float(S[i, 1]), float(S[i, 2]))
             
     def rotate_selected_objects(self, control_data):
         """Rotate selected objects based on hand movement"""
@@ -322,9 +508,17 @@ class CADSystem:
         # Calculate rotation amount based on hand position
         rotation_y = (position[0] - 0.5) * 5  # Map x-position to rotation
         
-        for obj in self.selected_objects:
-            # Apply rotation gradually
-            obj.rotation_y += rotation_y
+        # Dead zone: a still hand shouldn't dirty every selected transform
+        if abs(rotation_y) < 1e-4:
+            return
+            
+        if self._sel_stale:
+            self._sync_selection_arrays()
+            
+        # Apply rotation gradually
+        self._sel_rot_y += rotation_y
+        for i, obj in enumerate(self.selected_objects):
+            obj.rotation_y = float(self._sel_rot_y[i])
             
     def extrude_selected_faces(self, position, strength):
         """Extrude faces of selected objects"""
@@ -334,26 +528,46 @@ class CADSystem:
         # Get hand height
         height = position.y
         
-        for obj in self.selected_objects:
-            if obj.model_name == 'cube':
-                # Stretch cube in y direction based on hand height
-                current_height = obj.scale.y
-                target_height = max(0.1, height * strength * 2)
-                
-                # Smooth transition
-                new_height = lerp(current_height, target_height, time.dt * 3)
-                obj.scale = Vec3(obj.scale.x, new_height, obj.scale.z)
-                
-                # Move object to keep bottom face stationary
-                height_diff = (new_height - current_height) / 2
-                obj.y += height_diff
+        if self._sel_stale:
+            self._sync_selection_arrays()
+        P = self._sel_pos
+        S = self._sel_scale
+        
+        # Only cubes are extruded
+        cubes = self._sel_cube_idx
+        if not cubes.size:
+            return
+            
+        # Stretch cubes in y direction based on hand height, smoothly
+        target_height = max(0.1, height * strength * 2)
+        sy = S[cubes, 1]
+        new_sy = sy + (target_height - sy) * (time.dt * 3)
+        S[cubes, 1] = new_sy
+        
+        # Move objects to keep bottom faces stationary
+        P[cubes, 1] += (new_sy - sy) * 0.5
+        
+        sel = self.selected_objects
+        for i in cubes:
+            obj = sel[i]
+            obj.scale = Vec3(float(S[i, 0]), float(S[i, 1]), float(S[i, 2]))
+            obj.y = float(P[i, 1])
+            
+        self._scene_dirty = True
+        self._drones_dirty |= self._sel_has_drone
+        self.controller.invalidate_object_cache()
                 
-    def update_hover_highlight(self, all_objects):
-        """Highlight object under cursor"""
+    def update_hover_highlight(self, all_objects_set):
+        """Highlight object under cursor (all_objects_set is built once per frame by the caller)"""
+        now = perf_counter_ns()
+        if now - self._last_hover_check_ns < self._hover_interval_ns:
+            return
+        self._last_hover_check_ns = now
+        
         if not mouse.hovered_entity:
             if self.hover_object:
                 # Remove highlight
-                if self.hover_object not in self.selected_objects:
+                if id(self.hover_object) not in self._selected_set:
                     self.hover_object.color = self.hover_object.original_color
                 self.hover_object = None
             return
@@ -361,18 +575,18 @@ class CADSystem:
         entity = mouse.hovered_entity
         
         # Only highlight our objects, not ground or UI elements
-        if entity not in all_objects or entity in [e for e in self.grid_entities]:
+        if id(entity) in self._grid_ids or entity not in all_objects_set:
             return
             
         # Store original color if not already highlighted
         if entity != self.hover_object:
-            if self.hover_object and self.hover_object not in self.selected_objects:
+            if self.hover_object and id(self.hover_object) not in self._selected_set:
                 self.hover_object.color = self.hover_object.original_color
                 
             if not hasattr(entity, 'original_color'):
                 entity.original_color = entity.color
                 
-            if entity not in self.selected_objects:
-                entity.color = color.light_gray
+            if id(entity) not in self._selected_set:
+                entity.color = _LIGHT_GRAY
                 
             self.hover_object = entity
\ No newline at end of file
@@ -6,7 +6,10 @@ Integrates all components for a complete hand gesture CAD system
 
 import cv2
 import mediapipe as mp
+import sys
 import threading
+import queue
+import collections
 import time
 import random
 import math
@@ -18,8 +21,37 @@ from precision_tracking import PrecisionHandTracker
 from gesture_system import GestureSystem
 from cad_system import CADSystem
 from ui_manager import UIManager
+from frame_grabber import FreshestFrameGrabber, put_latest
+
+# Fingertip and matching MCP (knuckle) landmark indices (index, middle, ring, pinky)
+_TIP_IDX = np.array([8, 12, 16, 20])
+_MCP_IDX = np.array([5, 9, 13, 17])
+
+# Drone propeller (x, z) offsets from the body at 0/90/180/270 degrees
+_PROP_OFFSETS = tuple(
+    (math.cos(math.radians(a)) * 0.7, math.sin(math.radians(a)) * 0.7)
+    for a in (0, 90, 180, 270)
+)
+
+# Landmark index pairs of the hand skeleton, for drawing it in one polylines call
+_HAND_EDGES = np.array(sorted(mp.solutions.hands.HAND_CONNECTIONS), dtype=np.intp)
 
 class IronManController:
+    # Normalized hand space -> world: x [0,1] to [-10,10], y [0,1] to [7.5,-7.5]
+    # (inverted), depth to [0,10]
+    _HAND_TO_WORLD_SCALE = np.array([20.0, -15.0, 10.0], dtype=np.float32)
+    _HAND_TO_WORLD_OFFSET = np.array([-10.0, 7.5, 0.0], dtype=np.float32)
+    
+    # Sound effect name -> (duration in seconds, frequency in Hz)
+    SOUND_SPECS = {
+        "spawn": (0.2, 600),
+        "shoot": (0.1, 800),
+        "drone": (0.3, 300),
+        "explode": (0.5, 200),
+        "select": (0.1, 1200),
+        "toggle": (0.15, 900),
+    }
+    
     def __init__(self):
         # Control variables
         self.current_gesture = "none"
@@ -32,6 +64,19 @@ class IronManController:
         self.hand_position = None
         self.camera_control_active = False
         
+        # Resolution frames are downscaled to before hand tracking
+        self.inference_size = (320, 240)
+        
+        # Rolling average of hand tracking time, used to skip frames at the source
+        self._infer_ms = 0.0
+        self.frame_interval_ms = 33.0
+        
+        # One landmark buffer per tracked hand, reused by the camera thread every frame
+        self._lm_bufs = [np.empty((21, 3), dtype=np.float32) for _ in range(2)]
+        
+        # (fn, args) calls queued by the tracking threads, run in Ursina's update()
+        self._main_thread_ops = collections.deque()
+        
         # Initialize component systems
         self.ui_manager = UIManager()
         
@@ -39,6 +84,7 @@ class IronManController:
         self.setup_hand_tracking()
         self.setup_3d_world()
         self.setup_audio()
+        self._build_sound_cache()
         
         # Initialize CAD system after 3D world is set up
         self.cad_system = CADSystem(self)
@@ -60,8 +106,12 @@ class IronManController:
     def setup_hand_tracking(self):
         """Initialize hand tracking with improved settings"""
         self.mp_hands = mp.solutions.hands
+        # Video mode reuses the previous frame's landmarks as the tracking ROI,
+        # so the palm detector only reruns when tracking confidence drops;
+        # the lite landmark model keeps each tracked frame cheap
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
+            model_complexity=0,
             max_num_hands=2,
             min_detection_confidence=0.6,  # Lower threshold for better detection
             min_tracking_confidence=0.5
@@ -94,6 +144,20 @@ class IronManController:
         self.drones = []
         self.bullets = []
         
+        # Bullet positions/velocities, row i belongs to self.bullets[i]
+        self._bullet_pos = np.empty((0, 3), dtype=np.float32)
+        self._bullet_vel = np.empty((0, 3), dtype=np.float32)
+        
+        # Hover phase per drone, parallel to self.drones (float64: it is
+        # added to time.time(), which float32 can't resolve)
+        self._drone_phases = np.empty(0, dtype=np.float64)
+        
+        # Cached (N,3) positions of self.objects for collision tests and the
+        # set of hoverable entities, rebuilt only after the scene changes
+        self._obj_positions = np.empty((0, 3), dtype=np.float32)
+        self._all_objects_set = set()
+        self._objects_dirty = True
+        
         # Set up UI
         self.ui_elements = self.ui_manager.setup_ui()
         self.gesture_display = self.ui_elements["gesture_display"]
@@ -112,45 +176,30 @@ class IronManController:
             self.audio_enabled = False
             print("⚠️ Audio not available, but visuals will work!")
     
+    def _build_sound_cache(self):
+        """Synthesize every sound effect once so playback is just a lookup"""
+        self._sound_cache = {}
+        if not self.audio_enabled:
+            return
+            
+        try:
+            for name, (duration, frequency) in self.SOUND_SPECS.items():
+                # Simple beep generation
+                t = np.arange(int(duration * 22050), dtype=np.float32)
+                mono = (np.sin(2 * np.pi * frequency * t / 22050) * 0.3 * 32767).astype(np.int16)
+                stereo = np.repeat(mono[:, None], 2, axis=1)
+                self._sound_cache[name] = pygame.sndarray.make_sound(np.ascontiguousarray(stereo))
+        except Exception as e:
+            print(f"Sound error: {e}")
+    
     def play_sound_effect(self, sound_type):
         """Play sound effects"""
         if not self.audio_enabled:
             return
         
-        try:
-            if sound_type == "spawn":
-                duration = 0.2
-                frequency = 600
-            elif sound_type == "shoot":
-                duration = 0.1
-                frequency = 800
-            elif sound_type == "drone":
-                duration = 0.3
-                frequency = 300
-            elif sound_type == "explode":
-                duration = 0.5
-                frequency = 200
-            elif sound_type == "select":
-                duration = 0.1
-                frequency = 1200
-            elif sound_type == "toggle":
-                duration = 0.15
-                frequency = 900
-            else:
-                return
-                
-            # Simple beep generation
-            frames = int(duration * 22050)
-            arr = []
-            for i in range(frames):
-                wave = math.sin(2 * math.pi * frequency * i / 22050) * 0.3
-                arr.append([wave, wave])
-            
-            sound_array = np.array(arr, dtype=np.float32)
-            sound = pygame.sndarray.make_sound((sound_array * 32767).astype(np.int16))
+        sound = self._sound_cache.get(sound_type)
+        if sound is not None:
             sound.play()
-        except Exception as e:
-            print(f"Sound error: {e}")
     
     def execute_gesture_action(self, gesture):
         """Execute actions based on gesture in normal mode"""
@@ -211,11 +260,7 @@ class IronManController:
         drone.always_on_top = False
         
         # Propellers
-        for i in range(4):
-            angle = i * 90
-            prop_x = math.cos(math.radians(angle)) * 0.7
-            prop_z = math.sin(math.radians(angle)) * 0.7
-            
+        for prop_x, prop_z in _PROP_OFFSETS:
             Entity(
                 model='cube',
                 color=color.black,
@@ -224,6 +269,8 @@ class IronManController:
             )
         
         self.drones.append(drone)
+        self._drone_phases = np.append(self._drone_phases, hash(drone) % 100)
+        self.mark_scene_dirty()
         print(f"Drone spawned at {pos}")
     
     def spawn_box(self, pos=None):
@@ -245,6 +292,7 @@ class IronManController:
         box.original_color = chosen_color
         
         self.objects.append(box)
+        self.mark_scene_dirty()
         print(f"Box spawned at {pos}")
     
     def shoot_bullet(self):
@@ -261,6 +309,9 @@ class IronManController:
         # Give bullet velocity in camera direction
         bullet.velocity = camera.forward * 20
         self.bullets.append(bullet)
+        v = bullet.velocity
+        self._bullet_pos = np.vstack((self._bullet_pos, np.array([[start_pos.x, start_pos.y, start_pos.z]], dtype=np.float32)))
+        self._bullet_vel = np.vstack((self._bullet_vel, np.array([[v.x, v.y, v.z]], dtype=np.float32)))
         print("Bullet fired!")
     
     def rotate_all_objects(self):
@@ -270,6 +321,12 @@ class IronManController:
                 obj.rotation_y += random.uniform(30, 90)
         print("All objects rotated!")
     
+    @staticmethod
+    def _destroy_all(entities):
+        """Destroy a batch of entities"""
+        for e in entities:
+            destroy(e)
+    
     def create_explosion(self):
         """Create explosion effect"""
         explosion_colors = [color.red, color.orange, color.yellow, color.white]
@@ -280,77 +337,135 @@ class IronManController:
             random.uniform(-3, 5)
         )
         
-        for i in range(15):
-            # Calculate random offset from center
-            offset = (
-                random.uniform(-2, 2),
-                random.uniform(-1, 3),
-                random.uniform(-2, 2)
-            )
-            
-            position = (
-                explosion_center[0] + offset[0],
-                explosion_center[1] + offset[1],
-                explosion_center[2] + offset[2]
-            )
-            
-            explosion_bit = Entity(
+        # Draw all particle offsets, colors and scales in one go
+        offsets = np.random.uniform((-2, -1, -2), (2, 3, 2), size=(15, 3))
+        positions = np.asarray(explosion_center) + offsets
+        color_idx = np.random.randint(0, len(explosion_colors), 15)
+        scales = np.random.uniform(0.2, 0.8, 15)
+        
+        bits = [
+            Entity(
                 model='cube',
-                color=random.choice(explosion_colors),
-                scale=random.uniform(0.2, 0.8),
-                position=position
+                color=explosion_colors[ci],
+                scale=s,
+                position=(x, y, z)
             )
-            
-            # Make explosion bits disappear after 2 seconds
-            destroy(explosion_bit, delay=2)
+            for (x, y, z), ci, s in zip(positions.tolist(), color_idx.tolist(), scales.tolist())
+        ]
+        
+        # Make explosion bits disappear after 2 seconds, with a single timer for all of them
+        invoke(self._destroy_all, bits, delay=2)
         
         print("EXPLOSION CREATED!")
     
-    def update_world(self):
-        """Update world physics"""
+    def invalidate_object_cache(self):
+        """Flag cached object positions/membership for rebuild"""
+        self._objects_dirty = True
+        
+    def mark_scene_dirty(self):
+        """Invalidate every cached view of the scene after objects are added, removed or moved"""
+        self.invalidate_object_cache()
+        self.cad_system.mark_scene_dirty()
+        
+    def _refresh_object_cache(self):
+        """Rebuild cached object positions and the hoverable set if the scene changed"""
+        if not self._objects_dirty:
+            return
+            
+        self._obj_positions = np.array(
+            [[o.x, o.y, o.z] if o else [np.inf] * 3 for o in self.objects],
+            dtype=np.float32
+        ).reshape(-1, 3)
+        self._all_objects_set = set(self.objects)
+        self._all_objects_set.update(self.drones)
+        self._objects_dirty = False
+    
+    def update_bullets(self):
+        """Move all bullets at once, then resolve hits and cull far ones"""
+        self._refresh_object_cache()
+        
         # Move bullets
-        for bullet in self.bullets[:]:
-            if bullet and hasattr(bullet, 'velocity'):
-                bullet.position += bullet.velocity * time.dt
-                
-                # Check collision with objects
-                for obj in self.objects[:]:
-                    if obj and distance(bullet.position, obj.position) < 1:
-                        destroy(obj)
-                        destroy(bullet)
-                        self.objects.remove(obj)
-                        self.bullets.remove(bullet)
+        P = self._bullet_pos
+        P += self._bullet_vel * time.dt
+        
+        # Remove distant bullets (squared distance from origin, 50 units)
+        remove = np.einsum('ij,ij->i', P, P) > 2500
+        
+        # Check collision with objects: every bullet against every object at once
+        hit = np.zeros(len(self.objects), dtype=bool)
+        if len(self._obj_positions):
+            diffs = P[:, None, :] - self._obj_positions[None, :, :]
+            close = np.einsum('ijk,ijk->ij', diffs, diffs) < 1.0
+            
+            # Bullets in fire order each take the first object in range
+            # that an earlier bullet hasn't already destroyed
+            for b in np.flatnonzero(close.any(axis=1)).tolist():
+                for o in np.flatnonzero(close[b]).tolist():
+                    if not hit[o]:
+                        hit[o] = True
+                        remove[b] = True
                         print("HIT!")
                         break
-                
-                # Remove distant bullets
-                if distance(bullet.position, Vec3(0, 0, 0)) > 50:
+        
+        # Rebuild the object list/positions once from the hit mask (no per-hit pop)
+        if hit.any():
+            survivors = []
+            for obj, was_hit in zip(self.objects, hit.tolist()):
+                if was_hit:
+                    destroy(obj)
+                    self._all_objects_set.discard(obj)
+                else:
+                    survivors.append(obj)
+            self.objects = survivors
+            
+            # The filtered positions stay parallel to the survivors, so the
+            # collision cache is still valid; only the CAD index needs a rebuild
+            self._obj_positions = self._obj_positions[~hit]
+            self.cad_system.mark_scene_dirty()
+        
+        if remove.any():
+            keep = ~remove
+            for bullet, gone in zip(self.bullets, remove.tolist()):
+                if gone:
                     destroy(bullet)
-                    self.bullets.remove(bullet)
-        
-        # Animate drones
-        for drone in self.drones:
-            if drone:
-                drone.rotation_y += 120 * time.dt
-                # Make drones hover
-                drone.y += math.sin(time.time() * 2 + hash(drone) % 100) * 0.01
+            self.bullets = [bullet for bullet, kept in zip(self.bullets, keep.tolist()) if kept]
+            self._bullet_pos = P = P[keep]
+            self._bullet_vel = self._bullet_vel[keep]
+        
+        # Push the new positions back to the surviving entities
+        for bullet, pos in zip(self.bullets, P.tolist()):
+            bullet.position = pos
+    
+    def update_world(self):
+        """Update world physics"""
+        if self.bullets:
+            self.update_bullets()
+        
+        # Animate drones, computing every hover offset in one go
+        if self.drones:
+            spin = 120 * time.dt
+            hover = (np.sin(time.time() * 2 + self._drone_phases) * 0.01).tolist()
+            for drone, dy in zip(self.drones, hover):
+                if drone:
+                    drone.rotation_y += spin
+                    drone.y += dy
+
+            # Drones aren't in the collision cache, only the CAD index moves
+            self.cad_system.mark_drones_moved()
                 
         # Update CAD mode hover highlight if active
         if self.cad_system.active and self.cad_system.current_tool == "select":
-            self.cad_system.update_hover_highlight(self.objects + self.drones)
+            self._refresh_object_cache()
+            self.cad_system.update_hover_highlight(self._all_objects_set)
     
     def check_for_mode_toggle(self, landmarks):
         """Check for gesture to toggle between normal and CAD mode"""
         # We'll use a specific gesture: All fingers up + thumbs up held for a moment
-        thumb_extended = self.gesture_system.is_thumb_extended(landmarks)
-        
-        # Check if all fingers are extended
-        index_extended = landmarks[8][1] < landmarks[5][1]
-        middle_extended = landmarks[12][1] < landmarks[9][1]
-        ring_extended = landmarks[16][1] < landmarks[13][1]
-        pinky_extended = landmarks[20][1] < landmarks[17][1]
+        lm = np.asarray(landmarks)
         
-        all_extended = thumb_extended and index_extended and middle_extended and ring_extended and pinky_extended
+        # Check if all fingers are extended (one vectorized compare), then the thumb
+        all_extended = (bool(np.less(lm[_TIP_IDX, 1], lm[_MCP_IDX, 1]).all())
+                        and self.gesture_system.is_thumb_extended(lm))
         
         if all_extended:
             # If we're already timing a toggle, check if we've held long enough
@@ -359,14 +474,14 @@ class IronManController:
                 
                 if self.mode_toggle_cooldown <= 0:
                     # Toggle mode
-                    self.toggle_cad_mode()
+                    self.run_on_main_thread(self.toggle_cad_mode)
                     # Reset cooldown with negative value (prevents immediate re-toggle)
                     self.mode_toggle_cooldown = -self.mode_toggle_cooldown_time
             
             # If we're not in cooldown, start timing
             elif self.mode_toggle_cooldown == 0:
                 self.mode_toggle_cooldown = self.mode_toggle_cooldown_time
-                self.action_display.text = "HOLD TO SWITCH MODES..."
+                self.run_on_main_thread(setattr, self.action_display, 'text', "HOLD TO SWITCH MODES...")
         else:
             # If gesture released and not in negative cooldown, reset
             if self.mode_toggle_cooldown > 0:
@@ -388,52 +503,82 @@ class IronManController:
         if "tool_selection" in gestures:
             tool_data = gestures["tool_selection"]
             if tool_data["confidence"] > 0.8:
-                self.cad_system.set_tool(tool_data["tool"])
+                # The tool is plain state the branches below need this frame, so set it
+                # here; only the on-screen label has to wait for the main thread
+                self.cad_system.current_tool = tool_data["tool"]
+                self.run_on_main_thread(self.cad_system.update_tool_display)
                 self.play_sound_effect("toggle")
         
         # Process gestures based on current tool
-        if self.cad_system.current_tool == "select" and "precision_point" in gestures:
+        tool = self.cad_system.current_tool
+        if tool == "select" and "precision_point" in gestures:
             point_data = gestures["precision_point"]
             if point_data["confidence"] > 0.8:
                 world_pos = self.hand_to_world_position(point_data["position"])
-                self.cad_system.select_object_at(world_pos)
+                self.run_on_main_thread(self.cad_system.select_object_at, world_pos)
                 
-        elif self.cad_system.current_tool == "create" and "precision_point" in gestures:
+        elif tool == "create" and "precision_point" in gestures:
             point_data = gestures["precision_point"]
             if point_data["confidence"] > 0.8:
                 world_pos = self.hand_to_world_position(point_data["position"])
-                self.cad_system.place_object_at(world_pos)
+                self.run_on_main_thread(self.cad_system.place_object_at, world_pos)
                 
-        elif self.cad_system.current_tool == "move" and "pinch" in gestures:
+        elif tool == "move" and "pinch" in gestures:
             pinch_data = gestures["pinch"]
             if pinch_data["confidence"] > 0.8:
                 world_pos = self.hand_to_world_position(pinch_data["position"])
-                self.cad_system.move_selected_objects(world_pos)
+                self.run_on_main_thread(self.cad_system.move_selected_objects, world_pos)
                 
-        elif self.cad_system.current_tool == "scale" and "spread_scale" in gestures:
+        elif tool == "scale" and "spread_scale" in gestures:
             scale_data = gestures["spread_scale"]
             if scale_data["confidence"] > 0.5:
-                self.cad_system.scale_selected_objects(scale_data["scale_factor"])
+                self.run_on_main_thread(self.cad_system.scale_selected_objects, scale_data["scale_factor"])
                 
-        elif self.cad_system.current_tool == "rotate" and "three_finger_control" in gestures:
+        elif tool == "rotate" and "three_finger_control" in gestures:
             control_data = gestures["three_finger_control"]
             if control_data["confidence"] > 0.7:
-                self.cad_system.rotate_selected_objects(control_data)
+                self.run_on_main_thread(self.cad_system.rotate_selected_objects, control_data)
                 
-        elif self.cad_system.current_tool == "extrude" and "pinch" in gestures:
+        elif tool == "extrude" and "pinch" in gestures:
             pinch_data = gestures["pinch"]
             if pinch_data["confidence"] > 0.8:
                 world_pos = self.hand_to_world_position(pinch_data["position"])
-                self.cad_system.extrude_selected_faces(world_pos, pinch_data["strength"])
+                self.run_on_main_thread(self.cad_system.extrude_selected_faces, world_pos, pinch_data["strength"])
                 
         return gestures
                 
+    def run_on_main_thread(self, fn, *args):
+        """Queue a call that touches Ursina state to run in the next update()"""
+        self._main_thread_ops.append((fn, args))
+        
+    def run_main_thread_ops(self):
+        """Run every call queued by the tracking threads (main thread only)"""
+        ops = self._main_thread_ops
+        while ops:
+            fn, args = ops.popleft()
+            fn(*args)
+            
+    def _tick(self):
+        """Per-frame hook: run the queued main-thread calls, then step the world"""
+        self.run_main_thread_ops()
+        self.update_world()
+        
+    def register_update_hook(self):
+        """Install _tick as the per-frame update (Ursina only calls __main__.update)"""
+        sys.modules['__main__'].update = self._tick
+            
+    def steer_camera(self, target_pos):
+        """Ease the camera towards target_pos"""
+        try:
+            camera.position = lerp(camera.position, target_pos, time.dt * 1.5)
+        except Exception as e:
+            print(f"Camera control error: {e}")
+    
     def hand_to_world_position(self, hand_pos):
         """Convert normalized hand position to world position"""
-        # Map [0,1] hand space to world space
-        x = (hand_pos[0] - 0.5) * 20  # Map [0,1] to [-10,10]
-        y = (0.5 - hand_pos[1]) * 15  # Map [0,1] to [7.5,-7.5] (inverted y)
-        z = hand_pos[2] * 10          # Map depth to [0,10]
+        # Map [0,1] hand space to world space in one multiply-add
+        x, y, z = (np.asarray(hand_pos, dtype=np.float32) * self._HAND_TO_WORLD_SCALE
+                   + self._HAND_TO_WORLD_OFFSET).tolist()
         
         return Vec3(x, y, z)
     
@@ -450,6 +595,52 @@ class IronManController:
             
         self.play_sound_effect("toggle")
 
+    def inference_thread(self, grabber, result_q):
+        """Thread running hand tracking on the freshest captured frame"""
+        frame_id = 0
+        
+        # Inference-only buffers, reused every frame (the flipped frame itself
+        # travels downstream, so it can't be recycled here)
+        inf_w, inf_h = self.inference_size
+        small = np.empty((inf_h, inf_w, 3), dtype=np.uint8)
+        rgb_small = np.empty_like(small)
+        
+        while self.is_running:
+            frame_id, frame = grabber.read(frame_id)
+            if frame is None:
+                continue
+            
+            frame = cv2.flip(frame, 1)  # Mirror image
+            
+            # Process hands on a downscaled copy; landmarks come back
+            # normalized to [0,1], so they still map onto the full frame
+            cv2.resize(frame, self.inference_size, dst=small, interpolation=cv2.INTER_AREA)
+            cv2.cvtColor(small, cv2.COLOR_BGR2RGB, dst=rgb_small)
+            start = time.perf_counter()
+            results = self.hands.process(rgb_small)
+            self._infer_ms += ((time.perf_counter() - start) * 1000.0 - self._infer_ms) * 0.1
+            
+            # Don't even decode frames that would arrive while we're still busy
+            grabber.skip = max(0, int(self._infer_ms / self.frame_interval_ms) - 1)
+            
+            put_latest(result_q, (frame, results))
+    
+    def display_thread(self, display_q):
+        """Thread showing annotated camera frames, so GUI refresh never blocks tracking"""
+        try:
+            while self.is_running:
+                try:
+                    frame = display_q.get(timeout=0.05)
+                    cv2.imshow('Iron Man CAD System (Press Q to exit)', frame)
+                except queue.Empty:
+                    pass
+                
+                # Keep pumping window events even when no new frame arrived
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    self.is_running = False
+        finally:
+            cv2.destroyAllWindows()
+    
     def camera_control_thread(self):
         """Thread for camera and hand tracking"""
         # Make sure we're using the default camera (index 0)
@@ -459,49 +650,67 @@ class IronManController:
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
         
+        # Don't let the driver queue up frames behind slow processing
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        
         if not cap.isOpened():
             print("ERROR: Could not open camera!")
             return
         
+        # Pipeline: capture thread -> inference thread -> this thread (gestures + display).
+        # Each stage hands over only its latest output so none of them waits on the others.
+        grabber = FreshestFrameGrabber(cap)
+        grabber.start()
+        
+        result_q = queue.Queue(maxsize=1)
+        inference_thread = threading.Thread(
+            target=self.inference_thread, args=(grabber, result_q), daemon=True
+        )
+        inference_thread.start()
+        
+        display_q = queue.Queue(maxsize=1)
+        display_thread = threading.Thread(
+            target=self.display_thread, args=(display_q,), daemon=True
+        )
+        display_thread.start()
+        
         print("Camera control thread started!")
         
         while self.is_running:
-            ret, frame = cap.read()
-            if not ret:
-                print("Failed to get frame from camera. Retrying...")
-                time.sleep(0.5)
+            try:
+                frame, results = result_q.get(timeout=1.0)
+            except queue.Empty:
                 continue
             
-            frame = cv2.flip(frame, 1)  # Mirror image
             h, w, _ = frame.shape
             
-            # Process hands
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
-            
             # Reset gesture if no hands detected
             if not results.multi_hand_landmarks:
                 # Just gradually fade the UI displays
                 curr_gesture = self.gesture_display.text
                 if curr_gesture != "WAITING...":
-                    self.gesture_display.text = "WAITING..."
+                    self.run_on_main_thread(setattr, self.gesture_display, 'text', "WAITING...")
                     self.camera_control_active = False
                     
             if results.multi_hand_landmarks:
                 for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-                    # Draw hand landmarks with better visibility
-                    self.mp_drawing.draw_landmarks(
-                        frame, 
-                        hand_landmarks, 
-                        self.mp_hands.HAND_CONNECTIONS,
-                        self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                        self.mp_drawing_styles.get_default_hand_connections_style()
-                    )
+                    # Get landmarks as a (21,3) array, filled in place (one buffer per hand)
+                    landmarks = self._lm_bufs[hand_idx]
+                    landmarks[:] = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
                     
-                    # Get landmarks as array
-                    landmarks = []
-                    for lm in hand_landmarks.landmark:
-                        landmarks.append([lm.x, lm.y, lm.z])
+                    if self.debug_mode:
+                        # Draw hand landmarks with better visibility
+                        self.mp_drawing.draw_landmarks(
+                            frame, 
+                            hand_landmarks, 
+                            self.mp_hands.HAND_CONNECTIONS,
+                            self.mp_drawing_styles.get_default_hand_landmarks_style(),
+                            self.mp_drawing_styles.get_default_hand_connections_style()
+                        )
+                    else:
+                        # Plain skeleton: one C call instead of ~40 styled circles/lines
+                        pts = (landmarks[:, :2] * (w, h)).astype(np.int32)
+                        cv2.polylines(frame, pts[_HAND_EDGES], False, (0, 255, 0), 1)
                     
                     # Check for mode toggle gesture
                     self.check_for_mode_toggle(landmarks)
@@ -530,10 +739,11 @@ class IronManController:
                             # Update display with gesture name
                             display_name = self.gesture_system.get_gesture_name(gesture)
                             if self.gesture_display:
-                                self.gesture_display.text = f"{display_name}"
+                                self.run_on_main_thread(setattr, self.gesture_display, 'text', f"{display_name}")
                             
-                            # Execute action for normal mode
-                            self.execute_gesture_action(gesture)
+                            # Execute action for normal mode (the cooldown is checked
+                            # when it runs, so queued repeats are still throttled)
+                            self.run_on_main_thread(self.execute_gesture_action, gesture)
                         
                         # Camera control with open palm in normal mode
                         if gesture == "open_palm" and hand_idx == 0 and self.camera_control_active:
@@ -542,23 +752,19 @@ class IronManController:
                             move_x = (index_tip[0] - 0.5) * 6  # Increased sensitivity
                             move_y = (index_tip[1] - 0.5) * 6
                             
-                            try:
-                                # Smooth camera movement
-                                target_pos = Vec3(move_x, max(1, 3 - move_y), -8)
-                                camera.position = lerp(camera.position, target_pos, time.dt * 1.5)
-                            except Exception as e:
-                                print(f"Camera control error: {e}")
+                            # Smooth camera movement
+                            target_pos = Vec3(move_x, max(1, 3 - move_y), -8)
+                            self.run_on_main_thread(self.steer_camera, target_pos)
                                 
                         # Display gesture confidence bars in debug mode
                         if self.debug_mode and hasattr(self.gesture_system, 'gesture_confidence'):
                             self.ui_manager.draw_confidence_bars(frame, self.gesture_system.gesture_confidence)
             
             # Display camera feed with improved UI
-            # Add semi-transparent overlay for better text visibility
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (w, 60), (0, 0, 0), -1)
-            cv2.rectangle(overlay, (0, h-40), (w, h), (0, 0, 0), -1)
-            frame = cv2.addWeighted(overlay, 0.3, frame, 0.7, 0)
+            # Darken header/footer strips in place for better text visibility
+            # (same as blending a 30% black overlay, without a full-frame copy)
+            for strip in (frame[:60], frame[h-40:]):
+                np.multiply(strip, 0.7, out=strip, casting='unsafe')
             
             # Show different header based on mode
             header_text = "IRON MAN CAD SYSTEM" if self.cad_system.active else "IRON MAN INTERFACE"
@@ -573,15 +779,14 @@ class IronManController:
                 cv2.putText(frame, f"Current: {self.current_gesture}", 
                            (10, h-15), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
             
-            # Actually show the camera frame
-            cv2.imshow('Iron Man CAD System (Press Q to exit)', frame)
-            
-            if cv2.waitKey(5) & 0xFF == ord('q'):
-                self.is_running = False
-                break
+            # Hand the annotated frame to the display thread (drops it if one is still pending)
+            put_latest(display_q, frame)
         
+        grabber.stop()
+        inference_thread.join()
+        display_thread.join()
+        grabber.join()
         cap.release()
-        cv2.destroyAllWindows()
         print("Camera control stopped!")
 
     def run(self):
@@ -598,9 +803,8 @@ class IronManController:
         print("- Rock sign: Extrude tool")
         print("- Phone gesture: Rotate tool")
         
-        # Define update function for Ursina
-        def update():
-            self.update_world()
+        # Hook the per-frame update (drains the main-thread queue) into Ursina
+        self.register_update_hook()
         
         # Activate CAD mode immediately if specified
         if self.start_in_cad_mode:
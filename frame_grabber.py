@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Frame Grabber Module
+Keeps only the newest camera frame so slow processing never works on stale ones
+"""
+
+import queue
+import threading
+import time
+
+def put_latest(q, item):
+    """Put item on a bounded queue, dropping the oldest entry if it is full"""
+    while True:
+        try:
+            q.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                pass
+
+class FreshestFrameGrabber(threading.Thread):
+    def __init__(self, cap):
+        super().__init__(daemon=True)
+        self.cap = cap
+        self.running = True
+        
+        # Frames to grab() without decoding before each read(); set by the
+        # consumer when it can't keep up, since those frames would be dropped anyway
+        self.skip = 0
+
+        # Latest frame slot (overwritten on every capture) and its sequence number
+        self._cond = threading.Condition()
+        self._frame = None
+        self._frame_id = 0
+
+    def run(self):
+        """Capture continuously, publishing each frame over the previous one"""
+        while self.running:
+            for _ in range(self.skip):
+                self.cap.grab()
+                
+            ret, frame = self.cap.read()
+            if not ret:
+                print("Failed to get frame from camera. Retrying...")
+                time.sleep(0.5)
+                continue
+
+            with self._cond:
+                self._frame = frame
+                self._frame_id += 1
+                self._cond.notify_all()
+
+    def read(self, last_id=0, timeout=1.0):
+        """Wait for a frame newer than last_id; returns (frame_id, frame) or (last_id, None)"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._frame_id > last_id or not self.running, timeout):
+                return last_id, None
+            if not self.running:
+                return last_id, None
+            return self._frame_id, self._frame
+
+    def stop(self):
+        """Stop capturing and wake up any waiting reader"""
+        self.running = False
+        with self._cond:
+            self._cond.notify_all()
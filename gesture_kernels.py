@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Gesture Kernels Module
+Numba-compiled helpers for per-frame gesture math on (21,3) landmark arrays
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def thumb_aligned(wx, wy, mx, my, tx, ty):
+    """True if the wrist->MCP and MCP->tip directions are roughly aligned"""
+    ax = mx - wx
+    ay = my - wy
+    bx = tx - mx
+    by = ty - my
+
+    na = np.sqrt(ax * ax + ay * ay)
+    nb = np.sqrt(bx * bx + by * by)
+    if na <= 0.0 or nb <= 0.0:
+        return False
+
+    return (ax * bx + ay * by) / (na * nb) > 0.7
+
+
+@njit(cache=True, fastmath=True)
+def thumb_extended(lm):
+    """Thumb extension from a (21,3) landmark array"""
+    return thumb_aligned(lm[0, 0], lm[0, 1], lm[2, 0], lm[2, 1], lm[4, 0], lm[4, 1])
+
+
+@njit(cache=True, fastmath=True)
+def finger_states(lm):
+    """Extension flags for (thumb, index, middle, ring, pinky)"""
+    out = np.empty(5, dtype=np.bool_)
+    out[0] = thumb_extended(lm)
+
+    # A finger counts as extended when its tip is above its PIP joint
+    for k in range(4):
+        tip = 8 + 4 * k
+        out[k + 1] = lm[tip, 1] < lm[tip - 2, 1]
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def pinch_distance(lm):
+    """2D distance between thumb tip and index tip"""
+    dx = lm[4, 0] - lm[8, 0]
+    dy = lm[4, 1] - lm[8, 1]
+    return np.sqrt(dx * dx + dy * dy)
+
+
+@njit(cache=True, fastmath=True)
+def gesture_mask(lm, pinch_threshold):
+    """Finger states and pinch packed as thumb | index<<1 | middle<<2 | ring<<3 | pinky<<4 | pinch<<5"""
+    states = finger_states(lm)
+    mask = 0
+    for k in range(5):
+        if states[k]:
+            mask |= 1 << k
+    if pinch_distance(lm) < pinch_threshold:
+        mask |= 1 << 5
+    return mask
+
+
+# Compile once at import so the first tracked frame doesn't stall
+_warmup = np.zeros((21, 3), dtype=np.float32)
+thumb_aligned(0.0, 0.0, 0.0, 1.0, 0.0, 2.0)
+finger_states(_warmup)
+pinch_distance(_warmup)
+gesture_mask(_warmup, 0.05)
+del _warmup
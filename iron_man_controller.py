@@ -7,15 +7,37 @@ The ultimate fusion of hand tracking + 3D world control!
 import cv2
 import mediapipe as mp
 import threading
+import queue
 import time
 from ursina import *
 import random
 import math
 import pygame
 import numpy as np
+import gesture_kernels
+from gesture_system import classify_landmarks
+from frame_grabber import FreshestFrameGrabber, put_latest
+from ui_manager import ConfidenceBarPanel
+
+# Drone propeller (x, z) offsets from the body at 0/90/180/270 degrees
+_PROP_OFFSETS = tuple(
+    (math.cos(math.radians(a)) * 0.7, math.sin(math.radians(a)) * 0.7)
+    for a in (0, 90, 180, 270)
+)
 
 class IronManController:
-    def __init__(self):
+    # Sound effect name -> (duration in seconds, frequency in Hz)
+    SOUND_SPECS = {
+        "spawn": (0.2, 600),
+        "shoot": (0.1, 800),
+        "drone": (0.3, 300),
+        "explode": (0.5, 200),
+    }
+    
+    def __init__(self, max_num_hands=1):
+        # Only the first hand drives actions; raise this to see more hands tracked
+        self.max_num_hands = max_num_hands
+        
         # Initialize components
         self.setup_hand_tracking()
         self.setup_3d_world()
@@ -32,15 +54,30 @@ class IronManController:
         self.hand_position = None
         self.camera_control_active = False
         
-        # For gesture visualization
+        # For gesture visualization (and the cached confidence bar panel)
         self.gesture_confidence = {}
+        self._confidence_panel = ConfidenceBarPanel()
+        
+        # One (21,3) landmark buffer per tracked hand, filled in place every frame
+        self._lm_bufs = [np.empty((21, 3), dtype=np.float32) for _ in range(self.max_num_hands)]
+        
+        # Hand tracking runs on every Nth frame, at reduced resolution
+        self._frame_skip = 2
+        self._frame_idx = 0
+        self.inference_size = (320, 240)
+        
+        # The preview window is refreshed at most this often (seconds); gestures
+        # are still processed on every frame
+        self.display_interval = 1 / 20
         
     def setup_hand_tracking(self):
         """Initialize hand tracking with improved settings"""
         self.mp_hands = mp.solutions.hands
+        # The lite landmark model is plenty for these six coarse poses
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
-            max_num_hands=2,
+            model_complexity=0,
+            max_num_hands=self.max_num_hands,
             min_detection_confidence=0.6,  # Lower threshold for better detection
             min_tracking_confidence=0.5
         )
@@ -71,6 +108,7 @@ class IronManController:
         self.objects = []
         self.drones = []
         self.bullets = []
+        self._drone_phases = np.empty(0, dtype=np.float64)
         
         # UI - Using plain text instead of emojis
         self.gesture_display = Text(
@@ -98,158 +136,73 @@ class IronManController:
         Entity(model='cube', color=color.orange, scale=0.8, position=(4, 0, 3))
         Entity(model='sphere', color=color.violet, scale=0.6, position=(-4, 0, 3))
         
+        # Reusable explosion bits, handed out round-robin instead of creating
+        # and destroying 15 Entities per explosion
+        self._explosion_pool = [Entity(model='cube', enabled=False) for _ in range(64)]
+        self._pool_idx = 0
+        
     def setup_audio(self):
-        """Initialize audio system"""
+        """Initialize audio system and synthesize every sound effect once"""
+        self._sound_cache = {}
         try:
             pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
             self.audio_enabled = True
         except:
             self.audio_enabled = False
             print("⚠️ Audio not available, but visuals will work!")
+            return
+        
+        try:
+            for name, (duration, frequency) in self.SOUND_SPECS.items():
+                # Simple beep generation
+                t = np.arange(int(duration * 22050), dtype=np.float32)
+                mono = (np.sin(2 * np.pi * frequency * t / 22050) * 0.3 * 32767).astype(np.int16)
+                stereo = np.repeat(mono[:, None], 2, axis=1)
+                self._sound_cache[name] = pygame.sndarray.make_sound(np.ascontiguousarray(stereo))
+        except Exception as e:
+            print(f"Sound error: {e}")
     
     def play_sound_effect(self, sound_type):
         """Play sound effects"""
         if not self.audio_enabled:
             return
         
-        try:
-            if sound_type == "spawn":
-                duration = 0.2
-                frequency = 600
-            elif sound_type == "shoot":
-                duration = 0.1
-                frequency = 800
-            elif sound_type == "drone":
-                duration = 0.3
-                frequency = 300
-            elif sound_type == "explode":
-                duration = 0.5
-                frequency = 200
-            else:
-                return
-                
-            # Simple beep generation
-            frames = int(duration * 22050)
-            arr = []
-            for i in range(frames):
-                wave = math.sin(2 * math.pi * frequency * i / 22050) * 0.3
-                arr.append([wave, wave])
-            
-            sound_array = np.array(arr, dtype=np.float32)
-            sound = pygame.sndarray.make_sound((sound_array * 32767).astype(np.int16))
+        sound = self._sound_cache.get(sound_type)
+        if sound is not None:
             sound.play()
-        except Exception as e:
-            print(f"Sound error: {e}")
     
     def detect_gesture(self, landmarks, hand_idx=0):
         """
         Improved hand gesture detection with better accuracy
+        (landmarks is a (21,3) float32 array)
         """
-        if not landmarks:
+        if landmarks is None or len(landmarks) == 0:
             return "none"
         
-        # Extract key points
-        wrist = np.array([landmarks[0][0], landmarks[0][1]])
-        thumb_tip = np.array([landmarks[4][0], landmarks[4][1]])
-        thumb_mcp = np.array([landmarks[2][0], landmarks[2][1]])
-        index_tip = np.array([landmarks[8][0], landmarks[8][1]])
-        index_pip = np.array([landmarks[6][0], landmarks[6][1]])
-        index_mcp = np.array([landmarks[5][0], landmarks[5][1]])
-        middle_tip = np.array([landmarks[12][0], landmarks[12][1]])
-        middle_pip = np.array([landmarks[10][0], landmarks[10][1]])
-        ring_tip = np.array([landmarks[16][0], landmarks[16][1]])
-        ring_pip = np.array([landmarks[14][0], landmarks[14][1]])
-        pinky_tip = np.array([landmarks[20][0], landmarks[20][1]])
-        pinky_pip = np.array([landmarks[18][0], landmarks[18][1]])
-        
-        # Calculate finger extension using improved vector approach
-        # A finger is extended if tip is further from palm than pip
-        def distance(p1, p2):
-            return np.sqrt(np.sum((p1 - p2) ** 2))
-        
-        # Check if fingers are extended
-        thumb_extended = self.is_thumb_extended(landmarks)
-        index_extended = index_tip[1] < index_pip[1] 
-        middle_extended = middle_tip[1] < middle_pip[1]
-        ring_extended = ring_tip[1] < ring_pip[1]
-        pinky_extended = pinky_tip[1] < pinky_pip[1]
-        
-        # Calculate pinch distance
-        pinch_distance = distance(thumb_tip, index_tip)
-        is_pinching = pinch_distance < 0.05  # Threshold for pinch detection
-        
-        # Store finger states
-        finger_states = [thumb_extended, index_extended, middle_extended, ring_extended, pinky_extended]
+        # Shared with GestureSystem: one compiled kernel call plus a table lookup
+        gesture, confidences = classify_landmarks(landmarks)
         
         # Debug logging
         if self.debug_mode and hand_idx == 0:
+            finger_states = gesture_kernels.finger_states(landmarks).tolist()
+            is_pinching = confidences["pinch"] > 0
             print(f"Finger states: {finger_states}, Pinch: {is_pinching:.3f}")
         
-        # Recognize gestures with confidence scores
-        confidences = {
-            "fist": 0,
-            "thumbs_up": 0,
-            "peace": 0,
-            "open_palm": 0,
-            "pinch": 0,
-            "rock_sign": 0
-        }
-        
-        # FIST: All fingers closed
-        if sum(finger_states) <= 1:
-            confidences["fist"] = 0.8
-            
-        # THUMBS UP: Only thumb extended
-        if thumb_extended and not index_extended and not middle_extended and not ring_extended and not pinky_extended:
-            confidences["thumbs_up"] = 0.9
-            
-        # PEACE: Index and middle fingers extended, others closed
-        if not thumb_extended and index_extended and middle_extended and not ring_extended and not pinky_extended:
-            confidences["peace"] = 0.9
-            
-        # OPEN PALM: All fingers extended
-        if sum(finger_states) >= 4:
-            confidences["open_palm"] = 0.9
-            
-        # PINCH: Thumb and index close together
-        if is_pinching:
-            confidences["pinch"] = 0.8
-            
-        # ROCK SIGN: Index, pinky extended (and maybe thumb)
-        if index_extended and not middle_extended and not ring_extended and pinky_extended:
-            confidences["rock_sign"] = 0.8
-            
         # Update the gesture confidence history (for visualization)
         self.gesture_confidence = confidences
         
-        # Return the gesture with highest confidence
-        best_gesture = max(confidences.items(), key=lambda x: x[1])
-        if best_gesture[1] > 0.5:  # Threshold for detection
-            return best_gesture[0]
-        
-        return "unknown"
+        return gesture
     
     def is_thumb_extended(self, landmarks):
         """
         Special function to detect thumb extension since it moves differently
         """
-        thumb_tip = landmarks[4]
-        thumb_mcp = landmarks[2] 
-        wrist = landmarks[0]
-        
-        # Calculate vectors
-        wrist_to_mcp = np.array([thumb_mcp[0] - wrist[0], thumb_mcp[1] - wrist[1]])
-        mcp_to_tip = np.array([thumb_tip[0] - thumb_mcp[0], thumb_tip[1] - thumb_mcp[1]])
-        
-        # Normalize vectors
-        wrist_to_mcp = wrist_to_mcp / np.linalg.norm(wrist_to_mcp)
-        mcp_to_tip = mcp_to_tip / np.linalg.norm(mcp_to_tip)
+        wrist, thumb_mcp, thumb_tip = landmarks[0], landmarks[2], landmarks[4]
         
-        # Dot product tells us alignment
-        dot_product = np.dot(wrist_to_mcp, mcp_to_tip)
-        
-        # If thumb is extended, vectors will be roughly aligned
-        return dot_product > 0.7  # Threshold for thumb extension
+        # If thumb is extended, wrist->MCP and MCP->tip will be roughly aligned
+        return gesture_kernels.thumb_aligned(float(wrist[0]), float(wrist[1]),
+                                             float(thumb_mcp[0]), float(thumb_mcp[1]),
+                                             float(thumb_tip[0]), float(thumb_tip[1]))
     
     def execute_gesture_action(self, gesture):
         """Execute actions based on gesture"""
@@ -308,12 +261,12 @@ class IronManController:
         # Add glowing effect
         drone.always_on_top = False
         
+        # Hover phase, also kept in an array parallel to self.drones
+        drone.phase = random.uniform(0, math.tau)
+        self._drone_phases = np.append(self._drone_phases, drone.phase)
+        
         # Propellers
-        for i in range(4):
-            angle = i * 90
-            prop_x = math.cos(math.radians(angle)) * 0.7
-            prop_z = math.sin(math.radians(angle)) * 0.7
-            
+        for prop_x, prop_z in _PROP_OFFSETS:
             Entity(
                 model='cube',
                 color=color.black,
@@ -366,6 +319,13 @@ class IronManController:
                 obj.rotation_y += random.uniform(30, 90)
         print("All objects rotated!")
     
+    @staticmethod
+    def _release_explosion_bits(bits):
+        """Return explosion bits to the pool unless they were handed out again since"""
+        for bit, stamp in bits:
+            if bit.pool_stamp == stamp:
+                bit.enabled = False
+    
     def create_explosion(self):
         """Create explosion effect"""
         explosion_colors = [color.red, color.orange, color.yellow, color.white]
@@ -376,86 +336,134 @@ class IronManController:
             random.uniform(-3, 5)
         )
         
-        for i in range(15):
-            # Calculate random offset from center
-            offset = (
-                random.uniform(-2, 2),
-                random.uniform(-1, 3),
-                random.uniform(-2, 2)
-            )
+        # Draw all particle offsets, colors and scales in one go
+        offsets = np.random.uniform((-2, -1, -2), (2, 3, 2), size=(15, 3))
+        positions = np.asarray(explosion_center) + offsets
+        color_idx = np.random.randint(0, len(explosion_colors), 15)
+        scales = np.random.uniform(0.2, 0.8, 15)
+        
+        bits = []
+        for (x, y, z), ci, s in zip(positions.tolist(), color_idx.tolist(), scales.tolist()):
+            explosion_bit = self._explosion_pool[self._pool_idx % len(self._explosion_pool)]
+            self._pool_idx += 1
             
-            position = (
-                explosion_center[0] + offset[0],
-                explosion_center[1] + offset[1],
-                explosion_center[2] + offset[2]
-            )
+            explosion_bit.position = (x, y, z)
+            explosion_bit.scale = s
+            explosion_bit.color = explosion_colors[ci]
+            explosion_bit.enabled = True
             
-            explosion_bit = Entity(
-                model='cube',
-                color=random.choice(explosion_colors),
-                scale=random.uniform(0.2, 0.8),
-                position=position
-            )
-            
-            # Make explosion bits disappear after 2 seconds
-            destroy(explosion_bit, delay=2)
+            # Stamp the bit so a late release can't hide it after it was reused
+            explosion_bit.pool_stamp = self._pool_idx
+            bits.append((explosion_bit, self._pool_idx))
+        
+        # Make explosion bits disappear after 2 seconds
+        invoke(self._release_explosion_bits, bits, delay=2)
         
         print("EXPLOSION CREATED!")
     
-    def update_world(self):
-        """Update world physics"""
-        # Move bullets
-        for bullet in self.bullets[:]:
+    def update_bullets(self):
+        """Move bullets, then test them against every object in one broadcast"""
+        for bullet in self.bullets:
             if bullet and hasattr(bullet, 'velocity'):
                 bullet.position += bullet.velocity * time.dt
-                
-                # Check collision with objects
-                for obj in self.objects[:]:
-                    if obj and distance(bullet.position, obj.position) < 1:
-                        destroy(obj)
-                        destroy(bullet)
-                        self.objects.remove(obj)
-                        self.bullets.remove(bullet)
+        
+        bp = np.array([(b.x, b.y, b.z) for b in self.bullets], dtype=np.float32).reshape(-1, 3)
+        
+        # Remove distant bullets (squared distance from origin, 50 units)
+        remove = np.einsum('ij,ij->i', bp, bp) > 2500
+        
+        # Check collision with objects: full (B,O) squared-distance matrix
+        hit = np.zeros(len(self.objects), dtype=bool)
+        if self.objects:
+            op = np.array([(o.x, o.y, o.z) if o else (np.inf,) * 3 for o in self.objects],
+                          dtype=np.float32).reshape(-1, 3)
+            diffs = bp[:, None, :] - op[None, :, :]
+            close = np.einsum('ijk,ijk->ij', diffs, diffs) < 1.0
+            
+            # Bullets in fire order each take the first object in range
+            # that an earlier bullet hasn't already destroyed
+            for b in np.flatnonzero(close.any(axis=1)).tolist():
+                for o in np.flatnonzero(close[b]).tolist():
+                    if not hit[o]:
+                        hit[o] = True
+                        remove[b] = True
                         print("HIT!")
                         break
-                
-                # Remove distant bullets
-                if distance(bullet.position, Vec3(0, 0, 0)) > 50:
+        
+        # Rebuild the object list once from the hit mask (no per-hit pop)
+        if hit.any():
+            survivors = []
+            for obj, was_hit in zip(self.objects, hit.tolist()):
+                if was_hit:
+                    destroy(obj)
+                else:
+                    survivors.append(obj)
+            self.objects = survivors
+        
+        if remove.any():
+            for bullet, gone in zip(self.bullets, remove.tolist()):
+                if gone:
                     destroy(bullet)
-                    self.bullets.remove(bullet)
+            self.bullets = [bullet for bullet, gone in zip(self.bullets, remove.tolist()) if not gone]
+    
+    def update_world(self):
+        """Update world physics"""
+        if self.bullets:
+            self.update_bullets()
+        
+        # Animate drones (module lookups and the clock read hoisted out of the loop)
+        _sin = math.sin
+        spin = 120 * time.dt
+        now2 = time.time() * 2
         
-        # Animate drones
-        for drone in self.drones:
+        # Make drones hover; past a handful of drones one np.sin beats the loop
+        if len(self.drones) > 16:
+            hover = (np.sin(now2 + self._drone_phases) * 0.01).tolist()
+        else:
+            hover = [_sin(now2 + drone.phase) * 0.01 for drone in self.drones]
+            
+        for drone, dy in zip(self.drones, hover):
             if drone:
-                drone.rotation_y += 120 * time.dt
-                # Make drones hover
-                drone.y += math.sin(time.time() * 2 + hash(drone) % 100) * 0.01
+                drone.rotation_y += spin
+                drone.y += dy
     
     def draw_confidence_bars(self, frame, confidences, pos=(20, 300), width=100, height=15, gap=20):
         """Draw confidence bars for each gesture"""
-        gestures = ["fist", "thumbs_up", "peace", "open_palm", "pinch", "rock_sign"]
+        self._confidence_panel.draw(frame, confidences, pos, width, height, gap)
+    
+    def inference_thread(self, grabber, result_q):
+        """Thread running hand tracking on the freshest captured frame"""
+        frame_id = 0
+        results = None
+        
+        # Inference-only buffers, reused every frame (the flipped frame itself
+        # travels downstream, so it can't be recycled here)
+        inf_w, inf_h = self.inference_size
+        small = np.empty((inf_h, inf_w, 3), dtype=np.uint8)
+        rgb_small = np.empty_like(small)
+        
+        # Bind per-frame calls to locals once
+        read, flip, resize, cvt = grabber.read, cv2.flip, cv2.resize, cv2.cvtColor
+        hands_process = self.hands.process
+        inference_size = self.inference_size
         
-        for i, gesture in enumerate(gestures):
-            conf = confidences.get(gesture, 0)
-            y_pos = pos[1] + i * gap
-            
-            # Draw gesture name
-            cv2.putText(frame, f"{gesture}", (pos[0] - 100, y_pos + 10), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+        while self.is_running:
+            frame_id, frame = read(frame_id)
+            if frame is None:
+                continue
             
-            # Draw background bar
-            cv2.rectangle(frame, (pos[0], y_pos), (pos[0] + width, y_pos + height), 
-                         (50, 50, 50), -1)
+            frame = flip(frame, 1)  # Mirror image
             
-            # Draw confidence bar
-            bar_width = int(conf * width)
-            color = (0, 255, 0) if conf > 0.5 else (0, 165, 255)
-            cv2.rectangle(frame, (pos[0], y_pos), (pos[0] + bar_width, y_pos + height), 
-                         color, -1)
+            # Process hands on a downscaled copy every Nth frame; in between, reuse
+            # the last results so gestures keep firing smoothly. Landmarks are
+            # normalized to [0,1], so they still map onto the full frame
+            self._frame_idx += 1
+            if self._frame_idx % self._frame_skip == 0 or results is None:
+                resize(frame, inference_size, dst=small, interpolation=cv2.INTER_AREA)
+                cvt(small, cv2.COLOR_BGR2RGB, dst=rgb_small)
+                results = hands_process(rgb_small)
             
-            # Draw percentage
-            cv2.putText(frame, f"{int(conf * 100)}%", (pos[0] + width + 10, y_pos + 10), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
+            put_latest(result_q, (frame, results))
     
     def camera_control_thread(self):
         """Thread for camera and hand tracking"""
@@ -470,21 +478,40 @@ class IronManController:
             print("ERROR: Could not open camera!")
             return
         
+        # Pipeline: capture thread -> inference thread -> this thread (gestures + display),
+        # joined by one-slot queues that drop stale items instead of queueing them
+        grabber = FreshestFrameGrabber(cap)
+        grabber.start()
+        
+        result_q = queue.Queue(maxsize=1)
+        inference_thread = threading.Thread(
+            target=self.inference_thread, args=(grabber, result_q), daemon=True
+        )
+        inference_thread.start()
+        
         print("Camera control thread started!")
         
+        # Bind per-frame calls to locals once
+        get_result = result_q.get
+        put_text, imshow, poll_key = cv2.putText, cv2.imshow, cv2.pollKey
+        last_shown = 0.0
+        
         while self.is_running:
-            ret, frame = cap.read()
-            if not ret:
-                print("Failed to get frame from camera. Retrying...")
-                time.sleep(0.5)
+            # Non-blocking key check, pumping window events on every pass
+            if poll_key() & 0xFF == ord('q'):
+                self.is_running = False
+                break
+            
+            try:
+                frame, results = get_result(timeout=0.05)
+            except queue.Empty:
                 continue
             
-            frame = cv2.flip(frame, 1)  # Mirror image
             h, w, _ = frame.shape
             
-            # Process hands
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            results = self.hands.process(rgb_frame)
+            # Only annotate and show frames at the display rate
+            now = time.perf_counter()
+            show = now - last_shown >= self.display_interval
             
             # Reset gesture if no hands detected
             if not results.multi_hand_landmarks:
@@ -497,18 +524,18 @@ class IronManController:
             if results.multi_hand_landmarks:
                 for hand_idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
                     # Draw hand landmarks with better visibility
-                    self.mp_drawing.draw_landmarks(
-                        frame, 
-                        hand_landmarks, 
-                        self.mp_hands.HAND_CONNECTIONS,
-                        self.mp_drawing_styles.get_default_hand_landmarks_style(),
-                        self.mp_drawing_styles.get_default_hand_connections_style()
-                    )
+                    if show:
+                        self.mp_drawing.draw_landmarks(
+                            frame, 
+                            hand_landmarks, 
+                            self.mp_hands.HAND_CONNECTIONS,
+                            self.mp_drawing_styles.get_default_hand_landmarks_style(),
+                            self.mp_drawing_styles.get_default_hand_connections_style()
+                        )
                     
-                    # Get landmarks as array
-                    landmarks = []
-                    for lm in hand_landmarks.landmark:
-                        landmarks.append([lm.x, lm.y, lm.z])
+                    # Get landmarks as a (21,3) array, filled in place (one buffer per hand)
+                    landmarks = self._lm_bufs[hand_idx]
+                    landmarks[:] = [(lm.x, lm.y, lm.z) for lm in hand_landmarks.landmark]
                     
                     # Detect gesture with improved algorithm
                     gesture = self.detect_gesture(landmarks, hand_idx)
@@ -548,29 +575,31 @@ class IronManController:
                         except Exception as e:
                             print(f"Camera control error: {e}")
             
+            if not show:
+                continue
+            
             # Display gesture confidence bars in debug mode
             if self.debug_mode and self.gesture_confidence:
                 self.draw_confidence_bars(frame, self.gesture_confidence)
             
             # Display camera feed with improved UI
-            # Add semi-transparent overlay for better text visibility
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (0, 0), (w, 60), (0, 0, 0), -1)
-            cv2.rectangle(overlay, (0, h-40), (w, h), (0, 0, 0), -1)
-            frame = cv2.addWeighted(overlay, 0.3, frame, 0.7, 0)
+            # Darken header/footer strips in place for better text visibility
+            # (same as blending a 30% black overlay, without a full-frame copy)
+            for strip in (frame[:60], frame[h-40:]):
+                np.multiply(strip, 0.7, out=strip, casting='unsafe')
             
-            cv2.putText(frame, "IRON MAN INTERFACE", 
-                       (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
-            cv2.putText(frame, f"Current: {self.current_gesture}", 
-                       (10, h-15), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
+            put_text(frame, "IRON MAN INTERFACE", 
+                     (10, 30), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (0, 255, 255), 2)
+            put_text(frame, f"Current: {self.current_gesture}", 
+                     (10, h-15), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 1)
             
             # Actually show the camera frame
-            cv2.imshow('Iron Man Hand Control (Press Q to exit)', frame)
-            
-            if cv2.waitKey(5) & 0xFF == ord('q'):
-                self.is_running = False
-                break
+            imshow('Iron Man Hand Control (Press Q to exit)', frame)
+            last_shown = now
         
+        grabber.stop()
+        inference_thread.join()
+        grabber.join()
         cap.release()
         cv2.destroyAllWindows()
         print("Camera control stopped!")
@@ -4,19 +4,109 @@ Precision Hand Tracking Module for CAD Operations
 Provides enhanced hand tracking capabilities for precise CAD manipulation
 """
 
+import math
+from collections import deque
 import numpy as np
-from scipy.spatial.transform import Rotation
-from filterpy.kalman import KalmanFilter
+import gesture_kernels
+from precision_tracking_kernels import kf_step_all, hand_quaternion
+
+# Fingertips tracked by the Kalman filters: thumb, index, middle, ring, pinky
+_TIP_IDS = np.array([4, 8, 12, 16, 20])
+_INDEX_TIP_ROW = 1  # Row of the index tip in _TIP_IDS-ordered arrays
+
+# Wrist and finger bases (less movement than fingertips)
+_PALM_IDS = np.array([0, 1, 5, 9, 13, 17])
+
+# Constant-velocity model shared by every fingertip: state pos(3) + vel(3),
+# measurement pos(3). F = [[I, I], [0, I]] and H = [I, 0] are hard-coded in
+# the compiled kernels rather than materialized as matrices. float32 like the
+# landmarks themselves, which is ample next to the measurement noise
+_KF_Q = np.eye(6, dtype=np.float32) * 0.01  # Process noise
+_KF_R = np.eye(3, dtype=np.float32) * 0.1   # Measurement noise
+_KF_P0 = np.eye(6, dtype=np.float32) * 0.1  # Initial covariance
+
+# Finger extension is tip above base: index, middle, ring, pinky
+_EXT_TIP_IDS = np.array([8, 12, 16, 20])
+_EXT_BASE_IDS = np.array([5, 9, 13, 17])
+_EXT_BIT_WEIGHTS = np.array([1, 2, 4, 8])
+_THUMB_BIT = 1 << 4
+_FINGER_BITS = _THUMB_BIT - 1
+
+# Shared by every tracker instance, so guard them against in-place edits
+for _const in (_TIP_IDS, _PALM_IDS, _KF_Q, _KF_R, _KF_P0, _EXT_TIP_IDS, _EXT_BASE_IDS, _EXT_BIT_WEIGHTS):
+    _const.setflags(write=False)
+del _const
+
+def _tool_rule(thumb_extended, index_extended, middle_extended, ring_extended, pinky_extended):
+    """Tool picked by one combination of finger states, or None"""
+    # One finger up (index): Select tool
+    if index_extended and not middle_extended and not ring_extended and not pinky_extended:
+        return "select"
+        
+    # Two fingers up (index + middle): Create tool
+    elif index_extended and middle_extended and not ring_extended and not pinky_extended:
+        return "create"
+        
+    # Three fingers up (index + middle + ring): Move tool
+    elif index_extended and middle_extended and ring_extended and not pinky_extended:
+        return "move"
+        
+    # Four fingers up (all except thumb): Scale tool
+    elif index_extended and middle_extended and ring_extended and pinky_extended:
+        return "scale"
+        
+    # Thumb + index + pinky (phone gesture): Rotate tool
+    elif thumb_extended and index_extended and not middle_extended and not ring_extended and pinky_extended:
+        return "rotate"
+        
+    # Rock sign (index + pinky): Extrude tool
+    elif index_extended and not middle_extended and not ring_extended and pinky_extended and not thumb_extended:
+        return "extrude"
+        
+    return None
+
+def _build_tool_lut():
+    """Evaluate the tool rules once for all 32 finger bitmasks"""
+    # Bit layout: index | middle<<1 | ring<<2 | pinky<<3 | thumb<<4
+    return tuple(_tool_rule((mask >> 4) & 1, *((mask >> bit) & 1 for bit in range(4)))
+                 for mask in range(32))
+
+# Finger bitmask -> tool name (or None), so tool selection is a table lookup
+TOOL_LUT = _build_tool_lut()
+
+class PrecisionData(dict):
+    """Result of PrecisionHandTracker.update(); derived fields are computed on first access"""
+    # Field -> tracker method computing it from the filtered landmarks
+    LAZY_FIELDS = {
+        "stable_palm": "_get_stable_palm",
+        "hand_orientation": "_calculate_hand_orientation"
+    }
+    
+    def __init__(self, tracker, **fields):
+        super().__init__(**fields)
+        self._tracker = tracker
+        
+    def __missing__(self, key):
+        if key not in self.LAZY_FIELDS:
+            raise KeyError(key)
+        value = getattr(self._tracker, self.LAZY_FIELDS[key])(self["landmarks"])
+        self[key] = value
+        return value
+        
+    def get(self, key, default=None):
+        if key in self or key in self.LAZY_FIELDS:
+            return self[key]
+        return default
 
 class PrecisionHandTracker:
     def __init__(self):
-        # Store previous frames for velocity calculation
-        self.prev_landmarks = None
-        self.landmark_history = []  # Last 5 frames for smoothing
+        # Last 5 frames for smoothing, as a ring buffer of (21,3) rows
         self.history_max = 5
+        self.landmark_history = np.zeros((self.history_max, 21, 3), dtype=np.float32)
+        self._history_count = 0
         
         # Initialize Kalman filters for each fingertip
-        self.filters = self._initialize_kalman_filters()
+        self._initialize_kalman_filters()
         
         # For precise gestures
         self.gesture_start_position = None
@@ -24,132 +114,81 @@ class PrecisionHandTracker:
         self.active_gestures = {}
         
         # For gesture history - helps with tool selection gestures
-        self.gesture_history = []
         self.max_gesture_history = 10  # Store up to 10 recent gestures
+        self.gesture_history = deque(maxlen=self.max_gesture_history)
         
     def _initialize_kalman_filters(self):
-        """Create Kalman filters for smooth tracking"""
-        filters = {}
-        for i in [4, 8, 12, 16, 20]:  # Thumb, index, middle, ring, pinky tips
-            kf = KalmanFilter(dim_x=6, dim_z=3)  # state: pos(3) + vel(3), measurement: pos(3)
-            kf.F = np.array([
-                [1, 0, 0, 1, 0, 0],  # x = x + vx
-                [0, 1, 0, 0, 1, 0],  # y = y + vy
-                [0, 0, 1, 0, 0, 1],  # z = z + vz
-                [0, 0, 0, 1, 0, 0],  # vx = vx
-                [0, 0, 0, 0, 1, 0],  # vy = vy
-                [0, 0, 0, 0, 0, 1]   # vz = vz
-            ])
-            kf.H = np.array([
-                [1, 0, 0, 0, 0, 0],
-                [0, 1, 0, 0, 0, 0],
-                [0, 0, 1, 0, 0, 0]
-            ])
-            kf.Q = np.eye(6) * 0.01  # Process noise
-            kf.R = np.eye(3) * 0.1   # Measurement noise
-            kf.P = np.eye(6) * 0.1   # Covariance
-            filters[i] = kf
-        return filters
+        """Create one batched Kalman filter state for all five fingertips"""
+        self.kf_x = np.zeros((len(_TIP_IDS), 6), dtype=np.float32)
+        self.kf_P = np.repeat(_KF_P0[None], len(_TIP_IDS), axis=0)
+        
+    def _kalman_step(self, z):
+        """Predict + update all fingertip filters at once with (5,3) measurements z"""
+        kf_step_all(self.kf_x, self.kf_P, z, _KF_Q, _KF_R)
+        return self.kf_x[:, :3]
         
     def update(self, landmarks):
         """Process new hand landmarks with precision tracking"""
         if landmarks is None:
             return None
             
-        # Keep history for smoothing
-        self.landmark_history.append(landmarks)
-        if len(self.landmark_history) > self.history_max:
-            self.landmark_history.pop(0)
+        # One contiguous (21,3) array for everything downstream
+        landmarks = np.ascontiguousarray(landmarks, dtype=np.float32)
+        
+        # Keep history for smoothing (overwrites the oldest frame once full)
+        self.landmark_history[self._history_count % self.history_max] = landmarks
+        self._history_count += 1
             
         # Apply Kalman filtering to fingertips
         filtered_landmarks = landmarks.copy()
-        for i in [4, 8, 12, 16, 20]:  # Filter fingertips for precision
-            pos = np.array([landmarks[i][0], landmarks[i][1], landmarks[i][2]])
-            
-            # Update Kalman filter
-            self.filters[i].predict()
-            self.filters[i].update(pos)
+        filtered_landmarks[_TIP_IDS] = self._kalman_step(landmarks[_TIP_IDS])
             
-            # Get filtered position
-            filtered_pos = self.filters[i].x[:3]
-            filtered_landmarks[i] = [filtered_pos[0], filtered_pos[1], filtered_pos[2]]
-            
-        # Calculate velocities if we have previous data
-        velocities = {}
-        if self.prev_landmarks is not None:
-            for i in [4, 8, 12, 16, 20]:
-                curr = np.array(filtered_landmarks[i])
-                prev = np.array(self.prev_landmarks[i])
-                velocities[i] = curr - prev
-        
-        self.prev_landmarks = filtered_landmarks
-        
-        return {
-            "landmarks": filtered_landmarks,
-            "velocities": velocities,
-            "stable_palm": self._get_stable_palm(filtered_landmarks),
-            "hand_orientation": self._calculate_hand_orientation(filtered_landmarks)
-        }
+        # Fingertip velocities (per frame) straight from the filter state, as
+        # (5,3) rows in _TIP_IDS order; copied so later steps don't mutate them
+        velocities = self.kf_x[:, 3:].copy()
+        
+        # Palm center and orientation are only computed if a consumer reads them
+        return PrecisionData(
+            self,
+            landmarks=filtered_landmarks,
+            velocities=velocities,
+            finger_mask=self._finger_mask(filtered_landmarks)
+        )
+        
+    def get_smoothed_landmarks(self):
+        """Mean of the buffered raw landmark frames, or None before the first update"""
+        if self._history_count == 0:
+            return None
+        return self.landmark_history[:min(self._history_count, self.history_max)].mean(axis=0)
         
     def _get_stable_palm(self, landmarks):
         """Calculate stable palm center for reference point"""
         # Use wrist and base of fingers (less movement than fingertips)
-        palm_points = [0, 1, 5, 9, 13, 17]  # Wrist and finger bases
-        palm_center = np.mean([landmarks[i] for i in palm_points], axis=0)
-        return palm_center
+        return landmarks[_PALM_IDS].mean(axis=0)
         
     def _calculate_hand_orientation(self, landmarks):
         """Calculate 3D orientation of the hand"""
-        try:
-            # Create vectors from wrist to middle finger base and pinky base
-            wrist = np.array(landmarks[0])
-            middle_base = np.array(landmarks[9])
-            pinky_base = np.array(landmarks[17])
-            
-            # Create two vectors to define the hand plane
-            v1 = middle_base - wrist  # Points "up" from wrist
-            v2 = pinky_base - wrist   # Points to side of hand
-            
-            # Normalize vectors (safely)
-            v1_norm = np.linalg.norm(v1)
-            v2_norm = np.linalg.norm(v2)
-            
-            if v1_norm > 0 and v2_norm > 0:
-                v1 = v1 / v1_norm
-                v2 = v2 / v2_norm
-                
-                # Get normal to hand plane
-                normal = np.cross(v1, v2)
-                normal_norm = np.linalg.norm(normal)
-                
-                if normal_norm > 0:
-                    normal = normal / normal_norm
-                    
-                    # Create rotation matrix from these vectors
-                    rotation_matrix = np.column_stack((v1, np.cross(normal, v1), normal))
-                    
-                    # Convert to quaternion for easier manipulation
-                    r = Rotation.from_matrix(rotation_matrix)
-                    return r.as_quat()
-            
-            # Fallback if any issues
-            return np.array([0, 0, 0, 1])  # Identity quaternion
-        except:
-            # Safety fallback
-            return np.array([0, 0, 0, 1]) 
+        # Quaternion of the palm frame (wrist -> middle base, wrist -> pinky base);
+        # identity if the points are degenerate
+        return hand_quaternion(landmarks)
         
     def detect_precise_gestures(self, data):
         """Detect precise gestures for CAD operations"""
         if not data:
             return {}
             
-        landmarks = data["landmarks"]
-        velocities = data.get("velocities", {})
+        landmarks = np.asarray(data["landmarks"])
+        velocities = data.get("velocities")
+        
+        # Finger states are shared by every detector below
+        mask = data.get("finger_mask")
+        if mask is None:
+            mask = self._finger_mask(landmarks)
         
         gestures = {}
         
         # Precision point (index finger pointing with minimal movement)
-        if self._is_index_precision_pointing(landmarks, velocities):
+        if self._is_index_precision_pointing(mask, velocities):
             gestures["precision_point"] = {
                 "confidence": 0.9,
                 "position": landmarks[8],  # Index fingertip
@@ -161,7 +200,7 @@ class PrecisionHandTracker:
         if pinch_degree < 0.05:  # Close pinch
             gestures["pinch"] = {
                 "confidence": 0.9,
-                "position": (np.array(landmarks[4]) + np.array(landmarks[8])) / 2,  # Between thumb and index
+                "position": (landmarks[4] + landmarks[8]) / 2,  # Between thumb and index
                 "strength": 1.0 - pinch_degree * 20  # 0-1 strength based on closeness
             }
             
@@ -173,7 +212,7 @@ class PrecisionHandTracker:
         }
         
         # Three-finger system for fine controls
-        if self._is_three_finger_control(landmarks):
+        if self._is_three_finger_control(mask):
             gestures["three_finger_control"] = {
                 "confidence": 0.8,
                 "position": landmarks[12],  # Middle fingertip
@@ -181,153 +220,81 @@ class PrecisionHandTracker:
             }
             
         # CAD Tool selection gestures
-        tool_gesture = self.detect_tool_selection_gesture(landmarks)
+        tool_gesture = self.detect_tool_selection_gesture(landmarks, mask)
         if tool_gesture:
             gestures["tool_selection"] = tool_gesture
             
         return gestures
         
-    def detect_tool_selection_gesture(self, landmarks):
+    def _finger_mask(self, landmarks):
+        """Finger extension packed as index | middle<<1 | ring<<2 | pinky<<3 | thumb<<4"""
+        ys = landmarks[:, 1]
+        mask = int((ys[_EXT_TIP_IDS] < ys[_EXT_BASE_IDS]) @ _EXT_BIT_WEIGHTS)
+        if self.is_thumb_extended(landmarks):
+            mask |= _THUMB_BIT
+        return mask
+        
+    def detect_tool_selection_gesture(self, landmarks, mask=None):
         """Detect gestures specifically for tool selection"""
-        # Count extended fingers
-        thumb_extended = self.is_thumb_extended(landmarks)
-        index_extended = landmarks[8][1] < landmarks[5][1]
-        middle_extended = landmarks[12][1] < landmarks[9][1]
-        ring_extended = landmarks[16][1] < landmarks[13][1]
-        pinky_extended = landmarks[20][1] < landmarks[17][1]
-        
-        extended_count = sum([index_extended, middle_extended, ring_extended, pinky_extended])
-        
-        # One finger up (index): Select tool
-        if index_extended and not middle_extended and not ring_extended and not pinky_extended:
-            return {"tool": "select", "confidence": 0.9}
-            
-        # Two fingers up (index + middle): Create tool
-        elif index_extended and middle_extended and not ring_extended and not pinky_extended:
-            return {"tool": "create", "confidence": 0.9}
-            
-        # Three fingers up (index + middle + ring): Move tool
-        elif index_extended and middle_extended and ring_extended and not pinky_extended:
-            return {"tool": "move", "confidence": 0.9}
+        if mask is None:
+            mask = self._finger_mask(np.asarray(landmarks))
             
-        # Four fingers up (all except thumb): Scale tool
-        elif index_extended and middle_extended and ring_extended and pinky_extended:
-            return {"tool": "scale", "confidence": 0.9}
-            
-        # Thumb + index + pinky (phone gesture): Rotate tool
-        elif thumb_extended and index_extended and not middle_extended and not ring_extended and pinky_extended:
-            return {"tool": "rotate", "confidence": 0.9}
-            
-        # Rock sign (index + pinky): Extrude tool
-        elif index_extended and not middle_extended and not ring_extended and pinky_extended and not thumb_extended:
-            return {"tool": "extrude", "confidence": 0.9}
-            
-        return None
+        tool = TOOL_LUT[mask]
+        if tool is None:
+            return None
+        return {"tool": tool, "confidence": 0.9}
         
     def is_thumb_extended(self, landmarks):
         """Special function to detect if thumb is extended"""
-        thumb_tip = landmarks[4]
-        thumb_ip = landmarks[3]
-        thumb_mcp = landmarks[2]
-        wrist = landmarks[0]
-        
-        # Calculate vectors
-        wrist_to_mcp = np.array([thumb_mcp[0] - wrist[0], thumb_mcp[1] - wrist[1]])
-        mcp_to_tip = np.array([thumb_tip[0] - thumb_mcp[0], thumb_tip[1] - thumb_mcp[1]])
-        
-        try:
-            # Normalize vectors
-            if np.linalg.norm(wrist_to_mcp) > 0 and np.linalg.norm(mcp_to_tip) > 0:
-                wrist_to_mcp = wrist_to_mcp / np.linalg.norm(wrist_to_mcp)
-                mcp_to_tip = mcp_to_tip / np.linalg.norm(mcp_to_tip)
-                
-                # Dot product tells us alignment
-                dot_product = np.dot(wrist_to_mcp, mcp_to_tip)
-                
-                # If thumb is extended, vectors will be roughly aligned
-                return dot_product > 0.7  # Threshold for thumb extension
-        except:
-            pass
-            
-        # Default if calculation fails
-        return False
+        # Wrist->MCP and MCP->tip roughly aligned; each norm is computed once in the kernel
+        return bool(gesture_kernels.thumb_extended(np.ascontiguousarray(landmarks, dtype=np.float32)))
         
-    def _is_index_precision_pointing(self, landmarks, velocities):
+    def _is_index_precision_pointing(self, mask, velocities):
         """Detect precise pointing with index finger"""
-        # Check if index is extended but others are closed
-        index_extended = landmarks[8][1] < landmarks[5][1]  # Y position comparison
-        middle_closed = not (landmarks[12][1] < landmarks[9][1])
-        ring_closed = not (landmarks[16][1] < landmarks[13][1])
-        pinky_closed = not (landmarks[20][1] < landmarks[17][1])
-        
-        pointing = index_extended and middle_closed and ring_closed and pinky_closed
+        # Check if index is extended but others are closed (thumb ignored)
+        pointing = mask & _FINGER_BITS == 0b0001
         
         # Check if finger is stable (low velocity)
         stable = False
-        if 8 in velocities:
-            velocity_magnitude = np.linalg.norm(velocities[8])
+        if velocities is not None:
+            v = velocities[_INDEX_TIP_ROW]
+            velocity_magnitude = math.sqrt(v @ v)
             stable = velocity_magnitude < 0.01  # Low movement
             
         return pointing and stable
         
     def _get_pointing_direction(self, landmarks):
         """Get direction vector of pointing finger"""
-        try:
-            index_tip = np.array(landmarks[8])
-            index_pip = np.array(landmarks[6])
-            direction = index_tip - index_pip
+        direction = landmarks[8] - landmarks[6]
+        mag = math.sqrt(direction @ direction)
+        if mag > 0:
+            return direction / mag
             
-            mag = np.linalg.norm(direction)
-            if mag > 0:
-                return direction / mag
-        except:
-            pass
-            
-        # Default fallback
+        # Default fallback for a zero-length finger
         return np.array([0, 0, 1])
         
     def _get_middle_direction(self, landmarks):
         """Get direction vector of middle finger"""
-        try:
-            middle_tip = np.array(landmarks[12])
-            middle_pip = np.array(landmarks[10])
-            direction = middle_tip - middle_pip
-            
-            mag = np.linalg.norm(direction)
-            if mag > 0:
-                return direction / mag
-        except:
-            pass
+        direction = landmarks[12] - landmarks[10]
+        mag = math.sqrt(direction @ direction)
+        if mag > 0:
+            return direction / mag
             
-        # Default fallback
+        # Default fallback for a zero-length finger
         return np.array([0, 0, 1])
         
     def _measure_pinch(self, landmarks):
         """Measure distance between thumb and index finger tips"""
-        thumb_tip = np.array(landmarks[4])
-        index_tip = np.array(landmarks[8])
-        distance = np.linalg.norm(thumb_tip - index_tip)
-        return distance
+        d = landmarks[4] - landmarks[8]
+        return math.sqrt(d @ d)
         
     def _measure_finger_spread(self, landmarks):
         """Measure how spread out the fingers are (for scaling)"""
-        tips = [8, 12, 16, 20]  # Index, middle, ring, pinky tips
-        tip_positions = [np.array(landmarks[i]) for i in tips]
-        
-        # Calculate average distance between adjacent fingertips
-        distances = []
-        for i in range(len(tip_positions)-1):
-            distances.append(np.linalg.norm(tip_positions[i] - tip_positions[i+1]))
+        # Average distance between adjacent index, middle, ring and pinky tips
+        gaps = np.diff(landmarks[_EXT_TIP_IDS], axis=0)
+        return np.linalg.norm(gaps, axis=1).mean()
         
-        if distances:
-            return np.mean(distances)
-        return 0
-        
-    def _is_three_finger_control(self, landmarks):
+    def _is_three_finger_control(self, mask):
         """Detect three fingers extended for precision control"""
-        index_extended = landmarks[8][1] < landmarks[5][1]
-        middle_extended = landmarks[12][1] < landmarks[9][1]
-        ring_extended = landmarks[16][1] < landmarks[13][1]
-        pinky_closed = not (landmarks[20][1] < landmarks[17][1])
-        
-        return index_extended and middle_extended and ring_extended and pinky_closed
\ No newline at end of file
+        # Index, middle and ring extended, pinky closed (thumb ignored)
+        return mask & _FINGER_BITS == 0b0111
\ No newline at end of file
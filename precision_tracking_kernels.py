@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Precision Tracking Kernels Module
+Numba-compiled fixed-size Kalman filter steps and hand-orientation math for the precision tracker
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, fastmath=True)
+def kf_predict(x, P, Q):
+    """Constant-velocity predict in place: x = F x, P = F P F^T + Q with F = [[I, I], [0, I]]"""
+    for i in range(3):
+        x[i] += x[i + 3]
+
+    # F P: add the velocity rows onto the position rows
+    for i in range(3):
+        for j in range(6):
+            P[i, j] += P[i + 3, j]
+
+    # (F P) F^T: add the velocity columns onto the position columns
+    for i in range(6):
+        for j in range(3):
+            P[i, j] += P[i, j + 3]
+
+    for i in range(6):
+        for j in range(6):
+            P[i, j] += Q[i, j]
+
+
+@njit(cache=True, fastmath=True)
+def kf_update(x, P, z, R, work):
+    """Position measurement update in place (H = [I, 0]), Joseph form covariance; work is (4,6,6) scratch"""
+    Si = work[0, :3, :3]
+    K = work[1, :, :3]
+    KR = work[1, :, 3:]
+    A = work[2]
+    AP = work[3]
+
+    # Innovation covariance S = P_pp + R and its inverse via cofactors (3x3 SPD)
+    s00 = P[0, 0] + R[0, 0]
+    s01 = P[0, 1] + R[0, 1]
+    s02 = P[0, 2] + R[0, 2]
+    s10 = P[1, 0] + R[1, 0]
+    s11 = P[1, 1] + R[1, 1]
+    s12 = P[1, 2] + R[1, 2]
+    s20 = P[2, 0] + R[2, 0]
+    s21 = P[2, 1] + R[2, 1]
+    s22 = P[2, 2] + R[2, 2]
+
+    c00 = s11 * s22 - s12 * s21
+    c01 = s02 * s21 - s01 * s22
+    c02 = s01 * s12 - s02 * s11
+    inv_det = 1.0 / (s00 * c00 + s10 * c01 + s20 * c02)
+
+    Si[0, 0] = c00 * inv_det
+    Si[0, 1] = c01 * inv_det
+    Si[0, 2] = c02 * inv_det
+    Si[1, 0] = (s12 * s20 - s10 * s22) * inv_det
+    Si[1, 1] = (s00 * s22 - s02 * s20) * inv_det
+    Si[1, 2] = (s02 * s10 - s00 * s12) * inv_det
+    Si[2, 0] = (s10 * s21 - s11 * s20) * inv_det
+    Si[2, 1] = (s01 * s20 - s00 * s21) * inv_det
+    Si[2, 2] = (s00 * s11 - s01 * s10) * inv_det
+
+    # Gain K = P H^T S^-1 (6x3)
+    K[:] = 0.0
+    for i in range(6):
+        for j in range(3):
+            for k in range(3):
+                K[i, j] += P[i, k] * Si[k, j]
+
+    # State update x += K (z - H x)
+    y0 = z[0] - x[0]
+    y1 = z[1] - x[1]
+    y2 = z[2] - x[2]
+    for i in range(6):
+        x[i] += K[i, 0] * y0 + K[i, 1] * y1 + K[i, 2] * y2
+
+    # P = (I - K H) P (I - K H)^T + K R K^T
+    for i in range(6):
+        for j in range(6):
+            A[i, j] = -K[i, j] if j < 3 else 0.0
+        A[i, i] += 1.0
+
+    AP[:] = 0.0
+    for i in range(6):
+        for j in range(6):
+            for k in range(6):
+                AP[i, j] += A[i, k] * P[k, j]
+
+    KR[:] = 0.0
+    for i in range(6):
+        for j in range(3):
+            for k in range(3):
+                KR[i, j] += K[i, k] * R[k, j]
+
+    for i in range(6):
+        for j in range(6):
+            acc = 0.0
+            for k in range(6):
+                acc += AP[i, k] * A[j, k]
+            for k in range(3):
+                acc += KR[i, k] * K[j, k]
+            P[i, j] = acc
+
+
+@njit(cache=True, fastmath=True)
+def mat_to_quat(m):
+    """Rotation matrix to (x, y, z, w) quaternion, Shepperd's method on the largest of trace/diagonal"""
+    q = np.empty(4)
+    trace = m[0, 0] + m[1, 1] + m[2, 2]
+
+    # Pick the best-conditioned component, same branch choice as SciPy's from_matrix
+    i = 0
+    if m[1, 1] > m[i, i]:
+        i = 1
+    if m[2, 2] > m[i, i]:
+        i = 2
+
+    if trace >= m[i, i]:
+        q[0] = m[2, 1] - m[1, 2]
+        q[1] = m[0, 2] - m[2, 0]
+        q[2] = m[1, 0] - m[0, 1]
+        q[3] = 1.0 + trace
+    else:
+        j = (i + 1) % 3
+        k = (j + 1) % 3
+        q[i] = 1.0 - trace + 2.0 * m[i, i]
+        q[j] = m[j, i] + m[i, j]
+        q[k] = m[k, i] + m[i, k]
+        q[3] = m[k, j] - m[j, k]
+
+    norm = np.sqrt(q[0] * q[0] + q[1] * q[1] + q[2] * q[2] + q[3] * q[3])
+    for n in range(4):
+        q[n] /= norm
+    return q
+
+
+@njit(cache=True, fastmath=True)
+def hand_quaternion(lm):
+    """Palm frame from wrist, middle base and pinky base as a quaternion; identity if degenerate"""
+    m = np.empty((3, 3))
+
+    # v1 points "up" from the wrist, v2 to the side of the hand
+    v1 = np.empty(3)
+    v2 = np.empty(3)
+    for a in range(3):
+        v1[a] = lm[9, a] - lm[0, a]
+        v2[a] = lm[17, a] - lm[0, a]
+
+    n1 = np.sqrt(v1[0] * v1[0] + v1[1] * v1[1] + v1[2] * v1[2])
+    n2 = np.sqrt(v2[0] * v2[0] + v2[1] * v2[1] + v2[2] * v2[2])
+    if not (n1 > 0.0 and n2 > 0.0):
+        return np.array([0.0, 0.0, 0.0, 1.0])
+    v1 /= n1
+    v2 /= n2
+
+    # Normal to the hand plane
+    nx = v1[1] * v2[2] - v1[2] * v2[1]
+    ny = v1[2] * v2[0] - v1[0] * v2[2]
+    nz = v1[0] * v2[1] - v1[1] * v2[0]
+    # Collinear points leave only rounding noise in the cross product
+    nn = np.sqrt(nx * nx + ny * ny + nz * nz)
+    if not nn > 1e-6:
+        return np.array([0.0, 0.0, 0.0, 1.0])
+    nx /= nn
+    ny /= nn
+    nz /= nn
+
+    # Columns: v1, normal x v1, normal
+    m[0, 0] = v1[0]
+    m[1, 0] = v1[1]
+    m[2, 0] = v1[2]
+    m[0, 1] = ny * v1[2] - nz * v1[1]
+    m[1, 1] = nz * v1[0] - nx * v1[2]
+    m[2, 1] = nx * v1[1] - ny * v1[0]
+    m[0, 2] = nx
+    m[1, 2] = ny
+    m[2, 2] = nz
+    return mat_to_quat(m)
+
+
+@njit(cache=True, fastmath=True)
+def kf_step_all(X, Ps, Z, Q, R):
+    """Predict + update every filter: X (n,6), Ps (n,6,6), Z (n,3) measurements"""
+    # One scratch block in the filter dtype, shared by every update
+    work = np.empty((4, 6, 6), dtype=Ps.dtype)
+    for n in range(X.shape[0]):
+        kf_predict(X[n], Ps[n], Q)
+        kf_update(X[n], Ps[n], Z[n], R, work)
+
+
+# Compile once at import so the first CAD frame doesn't stall; Q and R are
+# read-only module constants in the tracker, which numba types separately
+_warmup_q = np.eye(6, dtype=np.float32) * 0.01
+_warmup_r = np.eye(3, dtype=np.float32) * 0.1
+_warmup_q.setflags(write=False)
+_warmup_r.setflags(write=False)
+kf_step_all(np.zeros((1, 6), dtype=np.float32), np.eye(6, dtype=np.float32)[None] * 0.1,
+            np.zeros((1, 3), dtype=np.float32), _warmup_q, _warmup_r)
+del _warmup_q, _warmup_r
+hand_quaternion(np.zeros((21, 3), dtype=np.float32))
@@ -35,7 +35,7 @@ def install_packages():
         pip_path = os.path.join("venv", "bin", "pip")
     
     # Install packages
-    packages = ["ursina", "mediapipe", "opencv-python", "pygame", "numpy", "scipy", "filterpy"]
+    packages = ["ursina", "mediapipe", "opencv-python", "pygame", "numpy", "scipy", "numba"]
     for package in packages:
         print_colored(f"Installing {package}...", "yellow")
         subprocess.run([pip_path, "install", package])
@@ -24,16 +24,16 @@ except ImportError as e:
     print(f"❌ NumPy import failed: {e}")
 
 try:
-    from scipy.spatial.transform import Rotation
+    from scipy.spatial import cKDTree
     print("✅ SciPy imported successfully")
 except ImportError as e:
     print(f"❌ SciPy import failed: {e}")
 
 try:
-    from filterpy.kalman import KalmanFilter
-    print("✅ FilterPy imported successfully")
+    from numba import njit
+    print("✅ Numba imported successfully")
 except ImportError as e:
-    print(f"❌ FilterPy import failed: {e}")
+    print(f"❌ Numba import failed: {e}")
 
 try:
     from ursina import *
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Check that calls queued from the tracking threads run from the registered per-frame hook
+"""
+
+import collections
+import sys
+
+import pytest
+
+pytest.importorskip("ursina")
+pytest.importorskip("mediapipe")
+
+from controller import IronManController
+
+
+def test_queued_op_runs_from_registered_update_hook(monkeypatch):
+    # Bare controller: only the state the hook touches, no window or camera
+    controller = IronManController.__new__(IronManController)
+    controller._main_thread_ops = collections.deque()
+    world_steps = []
+    controller.update_world = lambda: world_steps.append(True)
+
+    monkeypatch.delattr(sys.modules['__main__'], 'update', raising=False)
+    controller.register_update_hook()
+
+    calls = []
+    controller.run_on_main_thread(calls.append, "ran")
+    assert calls == []
+
+    # What Ursina does once per frame
+    sys.modules['__main__'].update()
+
+    assert calls == ["ran"]
+    assert world_steps == [True]
+    assert not controller._main_thread_ops
@@ -8,11 +8,107 @@ import cv2
 import numpy as np
 from ursina import *
 
+# Gestures shown in the confidence bar panel, top to bottom
+_CONFIDENCE_GESTURES = ("fist", "thumbs_up", "peace", "open_palm", "pinch", "rock_sign")
+
+# CAD tools in selector order, with their on-screen labels
+_CAD_TOOLS = ("select", "create", "move", "scale", "rotate", "extrude")
+_CAD_TOOL_LABELS = tuple(tool.upper() for tool in _CAD_TOOLS)
+
+# Fingertips marked by the precision overlay: thumb, index, middle, ring, pinky
+_TIP_IDS = (4, 8, 12, 16, 20)
+
+# Text and overlay styling (BGR)
+_FONT = cv2.FONT_HERSHEY_SIMPLEX
+_COLOR_GRAY = (200, 200, 200)
+_COLOR_WHITE = (255, 255, 255)
+_COLOR_CYAN = (0, 255, 255)
+_COLOR_ACTIVE = (0, 120, 0)
+_COLOR_INACTIVE = (60, 60, 60)
+_COLOR_TIP = (0, 255, 0)
+_COLOR_ARROW = (0, 0, 255)
+_COLOR_PALM = (255, 0, 0)
+
+class ConfidenceBarPanel:
+    """Per-gesture confidence bars drawn onto camera frames, cached between frames"""
+    def __init__(self):
+        # Inputs of the last render and its (bounds, premultiplied color, inverse alpha)
+        self._key = None
+        self._cache = None
+        
+    def draw(self, frame, confidences, pos=(20, 300), width=100, height=15, gap=20):
+        """Blend the bars for confidences into frame, re-rendering only when the inputs changed"""
+        # The panel only changes with the confidences, so render it once per distinct
+        # set of values and blend the cached pixels in on every other frame
+        key = (tuple(confidences.get(g, 0) for g in _CONFIDENCE_GESTURES), pos, width, height, gap, frame.shape)
+        if key != self._key:
+            self._key = key
+            self._cache = self._render(frame.shape, confidences, pos, width, height, gap)
+            
+        if self._cache is None:
+            return
+            
+        (y0, y1, x0, x1), premult, inv_alpha = self._cache
+        region = frame[y0:y1, x0:x1]
+        cv2.add(cv2.multiply(region, inv_alpha, scale=1 / 255), premult, dst=region)
+        
+    def _render(self, shape, confidences, pos, width, height, gap):
+        """Render the bar panel as premultiplied color + inverse alpha, clipped to the frame"""
+        px, py = pos[0] - 100, pos[1] - 5
+        panel_shape = (len(_CONFIDENCE_GESTURES) * gap + height + 10, width + 160, 3)
+        
+        # Drawing once on black and once on white recovers the anti-aliased coverage:
+        # on_black = alpha * c, on_white - on_black = (1 - alpha) * 255
+        on_black = np.zeros(panel_shape, dtype=np.uint8)
+        on_white = np.full(panel_shape, 255, dtype=np.uint8)
+        
+        for panel in (on_black, on_white):
+            for i, gesture in enumerate(_CONFIDENCE_GESTURES):
+                conf = confidences.get(gesture, 0)
+                x_pos = pos[0] - px
+                y_pos = pos[1] - py + i * gap
+                
+                # Draw gesture name
+                cv2.putText(panel, f"{gesture}", (x_pos - 100, y_pos + 10), 
+                            _FONT, 0.5, _COLOR_GRAY, 1)
+                
+                # Draw background bar
+                cv2.rectangle(panel, (x_pos, y_pos), (x_pos + width, y_pos + height), 
+                              (50, 50, 50), -1)
+                
+                # Draw confidence bar
+                bar_width = int(conf * width)
+                color = (0, 255, 0) if conf > 0.5 else (0, 165, 255)
+                cv2.rectangle(panel, (x_pos, y_pos), (x_pos + bar_width, y_pos + height), 
+                              color, -1)
+                
+                # Draw percentage
+                cv2.putText(panel, f"{int(conf * 100)}%", (x_pos + width + 10, y_pos + 10), 
+                            _FONT, 0.4, _COLOR_GRAY, 1)
+                            
+        # Clip to the frame
+        h, w = shape[:2]
+        x0, y0 = max(px, 0), max(py, 0)
+        x1, y1 = min(px + panel_shape[1], w), min(py + panel_shape[0], h)
+        if x0 >= x1 or y0 >= y1:
+            return None
+            
+        src = (slice(y0 - py, y1 - py), slice(x0 - px, x1 - px))
+        premult = np.ascontiguousarray(on_black[src])
+        inv_alpha = np.ascontiguousarray(on_white[src] - premult)
+        return (y0, y1, x0, x1), premult, inv_alpha
+
 class UIManager:
     def __init__(self):
         # UI state tracking
         self.current_mode = "normal"  # normal or cad
         
+        # Confidence bar panel, re-rendered only when its inputs change
+        self._confidence_panel = ConfidenceBarPanel()
+        
+        # Tool selector column spans for the last frame width, as (width, [(x1, x2), ...])
+        self._tool_columns = (None, [])
+        
     def setup_ui(self):
         """Set up UI elements for both modes"""
         # Main UI elements
@@ -65,55 +161,31 @@ class UIManager:
     
     def draw_confidence_bars(self, frame, confidences, pos=(20, 300), width=100, height=15, gap=20):
         """Draw confidence bars for each gesture"""
-        gestures = ["fist", "thumbs_up", "peace", "open_palm", "pinch", "rock_sign"]
+        self._confidence_panel.draw(frame, confidences, pos, width, height, gap)
         
-        for i, gesture in enumerate(gestures):
-            conf = confidences.get(gesture, 0)
-            y_pos = pos[1] + i * gap
-            
-            # Draw gesture name
-            cv2.putText(frame, f"{gesture}", (pos[0] - 100, y_pos + 10), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
-            
-            # Draw background bar
-            cv2.rectangle(frame, (pos[0], y_pos), (pos[0] + width, y_pos + height), 
-                          (50, 50, 50), -1)
-            
-            # Draw confidence bar
-            bar_width = int(conf * width)
-            color = (0, 255, 0) if conf > 0.5 else (0, 165, 255)
-            cv2.rectangle(frame, (pos[0], y_pos), (pos[0] + bar_width, y_pos + height), 
-                          color, -1)
-            
-            # Draw percentage
-            cv2.putText(frame, f"{int(conf * 100)}%", (pos[0] + width + 10, y_pos + 10), 
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (200, 200, 200), 1)
-                        
     def draw_cad_tool_selector(self, frame, current_tool, h, w):
         """Draw CAD tool selection guide in camera window"""
         # Draw tool indicator at bottom
-        tools = ["select", "create", "move", "scale", "rotate", "extrude"]
-        
-        tool_width = w // len(tools)
-        for i, tool in enumerate(tools):
-            x1 = i * tool_width
-            x2 = (i+1) * tool_width
+        if self._tool_columns[0] != w:
+            tool_width = w // len(_CAD_TOOLS)
+            self._tool_columns = (w, [(i * tool_width, (i+1) * tool_width) for i in range(len(_CAD_TOOLS))])
             
+        for tool, label, (x1, x2) in zip(_CAD_TOOLS, _CAD_TOOL_LABELS, self._tool_columns[1]):
             # Background
-            color = (0, 120, 0) if tool == current_tool else (60, 60, 60)
+            color = _COLOR_ACTIVE if tool == current_tool else _COLOR_INACTIVE
             cv2.rectangle(frame, (x1, h-70), (x2, h-30), color, -1)
             
             # Tool name
-            cv2.putText(frame, tool.upper(), (x1 + 5, h-45),
-                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
+            cv2.putText(frame, label, (x1 + 5, h-45),
+                        _FONT, 0.5, _COLOR_WHITE, 1)
                         
         # Draw gesture guide
         cv2.putText(frame, "GESTURE TOOL SELECTION:", (10, h-85),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.6, (200, 200, 200), 1)
+                    _FONT, 0.6, _COLOR_GRAY, 1)
         cv2.putText(frame, "1 FINGER: SELECT | 2 FINGERS: CREATE | 3 FINGERS: MOVE", (10, h-105),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1) 
+                    _FONT, 0.5, _COLOR_GRAY, 1) 
         cv2.putText(frame, "4 FINGERS: SCALE | ROCK SIGN: EXTRUDE | PHONE: ROTATE", (10, h-125),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.5, (200, 200, 200), 1)
+                    _FONT, 0.5, _COLOR_GRAY, 1)
                     
     def visualize_precision_tracking(self, frame, precision_data, gestures):
         """Visualize precision tracking data on the camera frame"""
@@ -124,45 +196,35 @@ class UIManager:
         landmarks = precision_data["landmarks"]
         
         # Draw filtered fingertips
-        for i in [4, 8, 12, 16, 20]:  # Thumb, index, middle, ring, pinky tips
+        for i in _TIP_IDS:
             x, y = int(landmarks[i][0] * w), int(landmarks[i][1] * h)
-            cv2.circle(frame, (x, y), 8, (0, 255, 0), -1)
+            cv2.circle(frame, (x, y), 8, _COLOR_TIP, -1)
             
         # Draw pointing direction if available
-        try:
-            if "precision_point" in gestures:
-                point_data = gestures["precision_point"]
-                if point_data["confidence"] > 0.8:
-                    pos = point_data["position"]
-                    direction = point_data["direction"]
-                    
-                    # Make sure we get scalar values
-                    pos_x = float(pos[0]) if isinstance(pos[0], np.ndarray) else float(pos[0])
-                    pos_y = float(pos[1]) if isinstance(pos[1], np.ndarray) else float(pos[1])
-                    
-                    dir_x = float(direction[0]) if isinstance(direction[0], np.ndarray) else float(direction[0])
-                    dir_y = float(direction[1]) if isinstance(direction[1], np.ndarray) else float(direction[1])
-                    
-                    # Calculate endpoint for drawing the direction arrow
-                    start_x = int(pos_x * w)
-                    start_y = int(pos_y * h)
-                    end_x = int((pos_x + dir_x * 0.2) * w)
-                    end_y = int((pos_y + dir_y * 0.2) * h)
-                    
-                    # Draw arrow if points are valid
-                    if 0 <= start_x < w and 0 <= start_y < h and 0 <= end_x < w and 0 <= end_y < h:
-                        cv2.arrowedLine(frame, (start_x, start_y), (end_x, end_y), 
-                                       (0, 0, 255), 3)
-        except Exception as e:
-            # Safe error handling - just skip drawing if there's an issue
-            print(f"Visualization error (non-critical): {e}")
+        point_data = gestures.get("precision_point")
+        if point_data is not None and point_data["confidence"] > 0.8:
+            try:
+                # Screen-space x/y of the fingertip and of the arrow tip 0.2 along the direction
+                size = np.array([w, h], dtype=np.float64)
+                pos = np.asarray(point_data["position"], dtype=np.float64)[:2]
+                direction = np.asarray(point_data["direction"], dtype=np.float64)[:2]
+                start_x, start_y = (pos * size).astype(np.int32).tolist()
+                end_x, end_y = ((pos + direction * 0.2) * size).astype(np.int32).tolist()
+                
+                # Draw arrow if points are valid
+                if 0 <= start_x < w and 0 <= start_y < h and 0 <= end_x < w and 0 <= end_y < h:
+                    cv2.arrowedLine(frame, (start_x, start_y), (end_x, end_y), 
+                                   _COLOR_ARROW, 3)
+            except Exception as e:
+                # Safe error handling - just skip drawing if there's an issue
+                print(f"Visualization error (non-critical): {e}")
                 
         # Draw palm center
         try:
             palm = precision_data["stable_palm"]
             palm_x = int(float(palm[0]) * w)
             palm_y = int(float(palm[1]) * h)
-            cv2.circle(frame, (palm_x, palm_y), 12, (255, 0, 0), 2)
+            cv2.circle(frame, (palm_x, palm_y), 12, _COLOR_PALM, 2)
         except:
             pass
         
@@ -173,4 +235,4 @@ class UIManager:
             confidence = tool_gesture["confidence"]
             
             cv2.putText(frame, f"TOOL: {tool_name.upper()} ({int(confidence*100)}%)", 
-                        (10, 60), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (0, 255, 255), 2)
\ No newline at end of file
+                        (10, 60), _FONT, 0.6, _COLOR_CYAN, 2)
\ No newline at end of file